@@ -114,11 +114,15 @@ func (p *Module) PythonAPIDocs() map[string]types.ModuleDoc {
 			Functions: map[string]types.FunctionDoc{
 				"list_networks":               {Signature: "list_networks() -> list[dict]", Description: "List networks with CBT instances"},
 				"list_models":                 {Signature: "list_models(network, type=None, database=None, search=None) -> list[dict]", Description: "List all data models"},
+				"iter_models":                 {Signature: "iter_models(network, type=None, database=None, search=None) -> Iterator[dict]", Description: "Stream data models without buffering the whole catalog"},
 				"list_external_models":        {Signature: "list_external_models(network, database=None) -> list[dict]", Description: "List external ClickHouse models"},
 				"get_external_model":          {Signature: "get_external_model(network, id) -> dict", Description: "Get external model by ID (database.table)"},
+				"get_external_models":         {Signature: "get_external_models(network, ids) -> dict[str, dict]", Description: "Get several external models concurrently, keyed by ID"},
 				"get_external_bounds":         {Signature: "get_external_bounds(network, id=None) -> list|dict", Description: "Get data bounds for external models"},
 				"list_transformations":        {Signature: "list_transformations(network, database=None, type=None, status=None) -> list[dict]", Description: "List data transformations"},
 				"get_transformation":          {Signature: "get_transformation(network, id) -> dict", Description: "Get transformation details"},
+				"get_transformations":         {Signature: "get_transformations(network, ids) -> dict[str, dict]", Description: "Get several transformations concurrently, keyed by ID"},
+				"get_all_transformations":     {Signature: "get_all_transformations(network, database=None, transformations=None) -> dict[str, dict]", Description: "List transformations (or reuse an already fetched list) and fetch all their details concurrently"},
 				"get_transformation_coverage": {Signature: "get_transformation_coverage(network, id=None) -> list|dict", Description: "Get transformation coverage"},
 				"get_scheduled_runs":          {Signature: "get_scheduled_runs(network, id=None) -> list|dict", Description: "Get scheduled transformation runs"},
 				"get_interval_types":          {Signature: "get_interval_types(network) -> dict", Description: "Get interval type configurations"},
@@ -2,23 +2,49 @@
 
 from __future__ import annotations
 
-import os
-from typing import Any
+import functools
+from typing import Any, Iterator, Mapping
 
-from ethpandaops import _runtime
+from ethpandaops import _net, _runtime
+
+_NETWORKS_ENV = "ETHPANDAOPS_CBT_NETWORKS"
+
+
+def _networks() -> Mapping[str, str]:
+    # Network name -> CBT base URL (sorted, no trailing slash).
+    return _net.load(_NETWORKS_ENV)
 
 
 def _require_cbt_available() -> None:
-    if not os.environ.get("ETHPANDAOPS_CBT_NETWORKS", "").strip():
+    if not _networks():
+        raise ValueError("CBT is not enabled or no CBT instances are available.")
+
+
+def _get_network_url(network: str) -> str:
+    return _resolve_network_url(_net.raw(_NETWORKS_ENV), network)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_network_url(raw: str, network: str) -> str:
+    # Keyed by the raw env value as well, so hot callers get a single cache
+    # hit without going stale if the environment changes.
+    networks = _net.parse(raw)
+    if not networks:
         raise ValueError("CBT is not enabled or no CBT instances are available.")
+    try:
+        return networks[network]
+    except KeyError:
+        raise ValueError(
+            f"unknown network {network!r}. Available: {list(networks)}"
+        ) from None
 
 
 def list_networks() -> list[dict[str, str]]:
     _require_cbt_available()
-    data = _runtime.invoke_data("cbt.list_networks")
-    return data.get("networks", [])
+    return _runtime.thaw_records(_net.records(_net.raw(_NETWORKS_ENV), "cbt_url"))
 
 
+@_runtime.ttl_cache
 def list_models(
     network: str,
     type: str | None = None,
@@ -36,6 +62,23 @@ def list_models(
     return _runtime.invoke_json("cbt.list_models", args)
 
 
+def iter_models(
+    network: str,
+    type: str | None = None,
+    database: str | None = None,
+    search: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    _require_cbt_available()
+    args: dict[str, Any] = {"network": network}
+    if type is not None:
+        args["type"] = type
+    if database is not None:
+        args["database"] = database
+    if search is not None:
+        args["search"] = search
+    yield from _runtime.iter_json_items("cbt.list_models", args)
+
+
 def list_external_models(
     network: str,
     database: str | None = None,
@@ -55,6 +98,15 @@ def get_external_model(network: str, id: str) -> dict[str, Any]:
     )
 
 
+def get_external_models(network: str, ids: list[str]) -> dict[str, dict[str, Any]]:
+    _require_cbt_available()
+    results = _runtime.invoke_json_many(
+        "cbt.get_external_model",
+        [{"network": network, "id": id} for id in ids],
+    )
+    return dict(zip(ids, results))
+
+
 def get_external_bounds(
     network: str, id: str | None = None
 ) -> list[dict[str, Any]] | dict[str, Any]:
@@ -90,6 +142,30 @@ def get_transformation(network: str, id: str) -> dict[str, Any]:
     )
 
 
+def get_transformations(network: str, ids: list[str]) -> dict[str, dict[str, Any]]:
+    _require_cbt_available()
+    results = _runtime.invoke_json_many(
+        "cbt.get_transformation",
+        [{"network": network, "id": id} for id in ids],
+    )
+    return dict(zip(ids, results))
+
+
+def get_all_transformations(
+    network: str,
+    database: str | None = None,
+    transformations: list[dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    # Callers that already hold a list_transformations() result can pass it
+    # in to skip listing again.
+    if transformations is None:
+        transformations = list_transformations(network, database=database)
+    if not isinstance(transformations, list):
+        return {}
+    ids = [t["id"] for t in transformations if isinstance(t, dict) and t.get("id")]
+    return get_transformations(network, ids)
+
+
 def get_transformation_coverage(
     network: str, id: str | None = None
 ) -> list[dict[str, Any]] | dict[str, Any]:
@@ -119,9 +195,6 @@ def get_interval_types(network: str) -> dict[str, Any]:
 
 
 def link_model(network: str, id: str) -> str:
-    _require_cbt_available()
-    data = _runtime.invoke_data(
-        "cbt.link_model",
-        {"network": network, "id": id},
-    )
-    return data.get("url", "")
+    # CBT UI link: {base_url}/models/{database}/{table}, ID is "database.table".
+    base_url = _get_network_url(network)
+    return f"{base_url}/models/{id.replace('.', '/', 1)}"
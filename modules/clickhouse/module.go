@@ -19,6 +19,7 @@ import (
 var (
 	_ module.Module            = (*Module)(nil)
 	_ module.ProxyDiscoverable = (*Module)(nil)
+	_ module.LoggerAware       = (*Module)(nil)
 )
 
 // Module implements the module.Module interface for ClickHouse.
@@ -40,6 +41,11 @@ func (p *Module) Name() string { return "clickhouse" }
 // SchemaClient returns the schema discovery client, or nil if not initialized.
 func (p *Module) SchemaClient() ClickHouseSchemaClient { return p.schemaClient }
 
+// SetLogger injects the application logger used during schema discovery.
+func (p *Module) SetLogger(log logrus.FieldLogger) {
+	p.log = log.WithField("module", "clickhouse")
+}
+
 // SetProxyClient injects the proxy service for schema discovery.
 func (p *Module) SetProxyClient(client proxy.Service) {
 	p.proxySvc = client
@@ -180,6 +186,33 @@ func (p *Module) PythonAPIDocs() map[string]types.ModuleDoc {
 					},
 					Returns: "pandas.DataFrame",
 				},
+				"query_arrow": {
+					Signature:   "clickhouse.query_arrow(cluster: str, sql: str) -> pyarrow.Table",
+					Description: "Execute SQL query, return a typed pyarrow Table (ClickHouse column types preserved, no text parsing). Call .to_pandas() only if a DataFrame is needed",
+					Parameters: map[string]string{
+						"cluster": "'xatu' or 'xatu-cbt'",
+						"sql":     "SQL query string",
+					},
+					Returns: "pyarrow.Table",
+				},
+				"iter_arrow_batches": {
+					Signature:   "clickhouse.iter_arrow_batches(cluster: str, sql: str) -> Iterator[pyarrow.RecordBatch]",
+					Description: "Execute SQL query, yield typed pyarrow RecordBatches as they are decoded. Use for large results that can be filtered or written (e.g. with pyarrow.parquet.ParquetWriter) batch by batch without building one table",
+					Parameters: map[string]string{
+						"cluster": "'xatu' or 'xatu-cbt'",
+						"sql":     "SQL query string",
+					},
+					Returns: "Iterator of pyarrow.RecordBatch",
+				},
+				"query_many": {
+					Signature:   "clickhouse.query_many(cluster: str, sqls: list[str | tuple[str, str]]) -> list[pandas.DataFrame]",
+					Description: "Execute independent SQL queries concurrently, return one DataFrame per query in input order",
+					Parameters: map[string]string{
+						"cluster": "'xatu' or 'xatu-cbt' - default cluster for plain SQL entries",
+						"sqls":    "SQL strings, or (cluster, sql) pairs to query several clusters in one batch",
+					},
+					Returns: "list[pandas.DataFrame]",
+				},
 				"query_raw": {
 					Signature:   "clickhouse.query_raw(cluster: str, sql: str) -> tuple[list[tuple], list[str]]",
 					Description: "Execute SQL query, return raw tuples",
@@ -189,6 +222,15 @@ func (p *Module) PythonAPIDocs() map[string]types.ModuleDoc {
 					},
 					Returns: "(rows, column_names)",
 				},
+				"query_raw_many": {
+					Signature:   "clickhouse.query_raw_many(cluster: str, sqls: list[str | tuple[str, str]]) -> list[tuple[list[tuple], list[str]]]",
+					Description: "Execute independent SQL queries concurrently, return raw tuples per query in input order",
+					Parameters: map[string]string{
+						"cluster": "'xatu' or 'xatu-cbt' - default cluster for plain SQL entries",
+						"sqls":    "SQL strings, or (cluster, sql) pairs to query several clusters in one batch",
+					},
+					Returns: "list of (rows, column_names)",
+				},
 			},
 		},
 	}
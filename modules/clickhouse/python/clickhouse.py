@@ -1,20 +1,29 @@
 """Thin ClickHouse wrappers over the server operation API."""
 
-from typing import Any
+from __future__ import annotations
 
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
 
 from ethpandaops import _runtime
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
-def list_datasources() -> list[dict[str, Any]]:
-    """List available ClickHouse clusters."""
+
+@_runtime.ttl_cache
+def _datasources_snapshot() -> tuple[Mapping[str, Any], ...]:
     response = _runtime.invoke("clickhouse.list_datasources")
     data = response.get("data", {})
     datasources = data.get("datasources", [])
     if not isinstance(datasources, list):
         raise ValueError("Invalid clickhouse.list_datasources response shape")
-    return datasources
+    return _runtime.freeze_records(datasources)
+
+
+def list_datasources() -> list[dict[str, Any]]:
+    """List available ClickHouse clusters."""
+    return _runtime.thaw_records(_datasources_snapshot())
 
 
 def query(
@@ -33,6 +42,63 @@ def query(
     )
 
 
+def query_arrow(
+    cluster_name: str,
+    sql: str,
+    parameters: dict[str, Any] | None = None,
+) -> pa.Table:
+    """Execute a SQL query and return a typed pyarrow Table."""
+    return _runtime.invoke_arrow_table(
+        "clickhouse.query_arrow",
+        {
+            "cluster": cluster_name,
+            "sql": sql,
+            "parameters": parameters,
+        },
+    )
+
+
+def iter_arrow_batches(
+    cluster_name: str,
+    sql: str,
+    parameters: dict[str, Any] | None = None,
+) -> Iterator[pa.RecordBatch]:
+    """Execute a SQL query and yield pyarrow RecordBatches as they are decoded."""
+    return _runtime.iter_arrow_batches(
+        "clickhouse.query_arrow",
+        {
+            "cluster": cluster_name,
+            "sql": sql,
+            "parameters": parameters,
+        },
+    )
+
+
+def _batch_args(
+    cluster_name: str,
+    sqls: list[str | tuple[str, str]],
+    parameters: dict[str, Any] | None,
+) -> list[dict[str, Any]]:
+    # Entries may be plain SQL or (cluster, sql) pairs, so one batch can span
+    # clusters and still run concurrently.
+    args_list = []
+    for entry in sqls:
+        cluster, sql = entry if isinstance(entry, tuple) else (cluster_name, entry)
+        args_list.append({"cluster": cluster, "sql": sql, "parameters": parameters})
+    return args_list
+
+
+def query_many(
+    cluster_name: str,
+    sqls: list[str | tuple[str, str]],
+    parameters: dict[str, Any] | None = None,
+) -> list[pd.DataFrame]:
+    """Execute independent SQL queries concurrently, in input order."""
+    return _runtime.invoke_tsv_dataframe_many(
+        "clickhouse.query", _batch_args(cluster_name, sqls, parameters)
+    )
+
+
 def query_raw(
     cluster_name: str,
     sql: str,
@@ -47,3 +113,14 @@ def query_raw(
             "parameters": parameters,
         },
     )
+
+
+def query_raw_many(
+    cluster_name: str,
+    sqls: list[str | tuple[str, str]],
+    parameters: dict[str, Any] | None = None,
+) -> list[tuple[list[tuple], list[str]]]:
+    """Execute independent SQL queries concurrently, returning raw results."""
+    return _runtime.invoke_tsv_rows_many(
+        "clickhouse.query_raw", _batch_args(cluster_name, sqls, parameters)
+    )
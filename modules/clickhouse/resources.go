@@ -6,7 +6,9 @@ import (
 	"fmt"
 	"regexp"
 	"sort"
+	"strconv"
 	"strings"
+	"sync"
 
 	"github.com/mark3labs/mcp-go/mcp"
 	"github.com/sirupsen/logrus"
@@ -88,9 +90,25 @@ func RegisterSchemaResources(
 }
 
 // createTablesListHandler creates a handler for the clickhouse://tables resource.
+// The rendered list only changes when a cluster refreshes, so it is cached
+// and rebuilt only when any cluster's LastUpdated time changes.
 func createTablesListHandler(client ClickHouseSchemaClient) types.ReadHandler {
+	var (
+		mu        sync.Mutex
+		cachedKey string
+		cached    string
+	)
+
 	return func(_ context.Context, _ string) (string, error) {
 		allTables := client.GetAllTables()
+		key := tablesListCacheKey(allTables)
+
+		mu.Lock()
+		defer mu.Unlock()
+
+		if cached != "" && key == cachedKey {
+			return cached, nil
+		}
 
 		response := &TablesListResponse{
 			Description: "Available ClickHouse tables across xatu clusters. Use clickhouse://tables/{table_name} for detailed schema.",
@@ -134,8 +152,22 @@ func createTablesListHandler(client ClickHouseSchemaClient) types.ReadHandler {
 			return "", fmt.Errorf("marshaling tables list: %w", err)
 		}
 
-		return string(data), nil
+		cachedKey, cached = key, string(data)
+
+		return cached, nil
+	}
+}
+
+// tablesListCacheKey identifies a schema snapshot by each cluster's refresh time.
+func tablesListCacheKey(allTables map[string]*ClusterTables) string {
+	parts := make([]string, 0, len(allTables))
+	for clusterName, cluster := range allTables {
+		parts = append(parts, clusterName+"@"+strconv.FormatInt(cluster.LastUpdated.UnixNano(), 10))
 	}
+
+	sort.Strings(parts)
+
+	return strings.Join(parts, ",")
 }
 
 // createTableDetailHandler creates a handler for the clickhouse://tables/{table_name} resource.
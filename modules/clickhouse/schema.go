@@ -125,7 +125,8 @@ type clickhouseSchemaClient struct {
 
 	mu          sync.RWMutex
 	clusters    map[string]*ClusterTables
-	datasources map[string]string // cluster name -> datasource name
+	folded      map[string][]TableMatch // lower-cased table name -> matches across clusters
+	datasources map[string]string       // cluster name -> datasource name
 
 	done  chan struct{}
 	ready chan struct{} // closed when initial fetch completes
@@ -310,19 +311,37 @@ func (c *clickhouseSchemaClient) GetTableAll(tableName string) []TableMatch {
 		return matches
 	}
 
-	// Fall back to case-insensitive matching.
-	for clusterName, cluster := range c.clusters {
+	// Fall back to case-insensitive matching via the index built on refresh.
+	// Table names are validated ASCII identifiers, so lower-casing is
+	// equivalent to strings.EqualFold here.
+	if folded := c.folded[strings.ToLower(tableName)]; len(folded) > 0 {
+		return append([]TableMatch(nil), folded...)
+	}
+
+	return nil
+}
+
+// buildFoldedIndex maps lower-cased table names to their schemas in every
+// cluster, so case-insensitive lookups avoid scanning all tables.
+func buildFoldedIndex(clusters map[string]*ClusterTables) map[string][]TableMatch {
+	size := 0
+	for _, cluster := range clusters {
+		size += len(cluster.Tables)
+	}
+
+	folded := make(map[string][]TableMatch, size)
+
+	for clusterName, cluster := range clusters {
 		for name, schema := range cluster.Tables {
-			if strings.EqualFold(name, tableName) {
-				matches = append(matches, TableMatch{
-					Schema:      schema,
-					ClusterName: clusterName,
-				})
-			}
+			key := strings.ToLower(name)
+			folded[key] = append(folded[key], TableMatch{
+				Schema:      schema,
+				ClusterName: clusterName,
+			})
 		}
 	}
 
-	return matches
+	return folded
 }
 
 // backgroundRefresh periodically refreshes the schema data.
@@ -381,20 +400,39 @@ func (c *clickhouseSchemaClient) refresh(ctx context.Context) error {
 
 	newClusters := make(map[string]*ClusterTables, len(c.datasources))
 
+	// Clusters are independent, so discover them concurrently; each cluster
+	// still bounds its own table queries with schemaQueryConcurrency.
+	var wg sync.WaitGroup
+
+	var mu sync.Mutex
+
 	for clusterName, datasourceName := range c.datasources {
-		tables, err := c.discoverClusterSchema(ctx, clusterName, datasourceName, token)
-		if err != nil {
-			c.log.WithError(err).WithField("cluster", clusterName).Warn("Failed to discover cluster schema")
+		wg.Add(1)
 
-			continue
-		}
+		go func(clusterName, datasourceName string) {
+			defer wg.Done()
 
-		newClusters[clusterName] = tables
+			tables, err := c.discoverClusterSchema(ctx, clusterName, datasourceName, token)
+			if err != nil {
+				c.log.WithError(err).WithField("cluster", clusterName).Warn("Failed to discover cluster schema")
+
+				return
+			}
+
+			mu.Lock()
+			newClusters[clusterName] = tables
+			mu.Unlock()
+		}(clusterName, datasourceName)
 	}
 
+	wg.Wait()
+
+	folded := buildFoldedIndex(newClusters)
+
 	// Atomic update.
 	c.mu.Lock()
 	c.clusters = newClusters
+	c.folded = folded
 	c.mu.Unlock()
 
 	return nil
@@ -533,6 +571,7 @@ func (c *clickhouseSchemaClient) queryJSON(ctx context.Context, datasourceName,
 
 	q := req.URL.Query()
 	q.Set("default_format", "JSON")
+	q.Set("enable_http_compression", "1")
 	req.URL.RawQuery = q.Encode()
 
 	resp, err := c.httpClient.Do(req)
@@ -616,36 +655,55 @@ var systemDatabaseBlacklist = map[string]bool{
 	"_temporary_and_external_tables": true,
 }
 
+// systemTablesQuery lists every user table across non-system databases in a
+// single round trip. Filtering and projection happen server-side, so only
+// (database, name) pairs for relevant tables cross the wire.
+var systemTablesQuery = buildSystemTablesQuery()
+
+func buildSystemTablesQuery() string {
+	excluded := make([]string, 0, len(systemDatabaseBlacklist))
+	for db := range systemDatabaseBlacklist {
+		excluded = append(excluded, "'"+db+"'")
+	}
+
+	sort.Strings(excluded)
+
+	return "SELECT database, name FROM system.tables" +
+		" WHERE database NOT IN (" + strings.Join(excluded, ", ") + ")" +
+		" AND NOT is_temporary AND NOT endsWith(name, '_local')" +
+		" ORDER BY database, name"
+}
+
 // fetchTableListFromSystemTables discovers tables across per-network databases.
 // Used for clusters like xatu-cbt where tables live in per-network databases
-// (e.g. mainnet.fct_block_head). Discovers all databases, then lists tables
-// from each. Schema is only fetched from one representative database since
+// (e.g. mainnet.fct_block_head). Lists all tables from system.tables in one
+// query. Schema is only fetched from one representative database since
 // all network databases have identical table schemas.
 func (c *clickhouseSchemaClient) fetchTableListFromSystemTables(ctx context.Context, datasourceName, token string) ([]discoveredTable, error) {
-	databases, err := c.fetchDatabases(ctx, datasourceName, token)
+	result, err := c.queryJSON(ctx, datasourceName, token, systemTablesQuery)
 	if err != nil {
-		return nil, fmt.Errorf("discovering databases: %w", err)
-	}
-
-	if len(databases) == 0 {
-		return nil, nil
+		return nil, fmt.Errorf("listing tables from system.tables: %w", err)
 	}
 
 	// Collect tables from all databases to build the full network mapping.
 	// tableNetworks maps table name -> list of databases it exists in.
 	tableNetworks := make(map[string][]string, 256)
 
-	for _, db := range databases {
-		dbTables, err := c.fetchTablesFromDatabase(ctx, datasourceName, token, db)
-		if err != nil {
-			c.log.WithError(err).WithField("database", db).Debug("Failed to list tables from database")
+	for _, row := range result.Data {
+		db := strings.TrimSpace(asString(row["database"]))
+		name := strings.TrimSpace(asString(row["name"]))
 
+		if db == "" || name == "" {
 			continue
 		}
 
-		for _, name := range dbTables {
-			tableNetworks[name] = append(tableNetworks[name], db)
+		if err := validateIdentifier(db); err != nil {
+			c.log.WithError(err).WithField("database", db).Debug("Skipping database with invalid name")
+
+			continue
 		}
+
+		tableNetworks[name] = append(tableNetworks[name], db)
 	}
 
 	// Build discovered table list. Pick the first database as the representative
@@ -662,66 +720,6 @@ func (c *clickhouseSchemaClient) fetchTableListFromSystemTables(ctx context.Cont
 	return tables, nil
 }
 
-// fetchDatabases returns non-system database names from a ClickHouse cluster.
-func (c *clickhouseSchemaClient) fetchDatabases(ctx context.Context, datasourceName, token string) ([]string, error) {
-	result, err := c.queryJSON(ctx, datasourceName, token, "SHOW DATABASES")
-	if err != nil {
-		return nil, fmt.Errorf("executing SHOW DATABASES: %w", err)
-	}
-
-	column := pickColumn(result.Meta, "name")
-	if column == "" {
-		return nil, fmt.Errorf("SHOW DATABASES response missing columns")
-	}
-
-	databases := make([]string, 0, len(result.Data))
-	for _, row := range result.Data {
-		db := strings.TrimSpace(asString(row[column]))
-		if db == "" || systemDatabaseBlacklist[db] {
-			continue
-		}
-
-		databases = append(databases, db)
-	}
-
-	return databases, nil
-}
-
-// fetchTablesFromDatabase lists tables in a specific database.
-func (c *clickhouseSchemaClient) fetchTablesFromDatabase(ctx context.Context, datasourceName, token, database string) ([]string, error) {
-	if err := validateIdentifier(database); err != nil {
-		return nil, fmt.Errorf("validating database name: %w", err)
-	}
-
-	query := fmt.Sprintf("SHOW TABLES FROM `%s`", database)
-
-	result, err := c.queryJSON(ctx, datasourceName, token, query)
-	if err != nil {
-		return nil, fmt.Errorf("executing SHOW TABLES FROM %s: %w", database, err)
-	}
-
-	column := pickColumn(result.Meta, "name")
-	if column == "" {
-		return nil, fmt.Errorf("SHOW TABLES FROM %s response missing columns", database)
-	}
-
-	tables := make([]string, 0, len(result.Data))
-	for _, row := range result.Data {
-		name := strings.TrimSpace(asString(row[column]))
-		if name == "" {
-			continue
-		}
-
-		if strings.HasSuffix(name, "_local") {
-			continue
-		}
-
-		tables = append(tables, name)
-	}
-
-	return tables, nil
-}
-
 // validateIdentifier validates a ClickHouse table/column identifier to prevent SQL injection.
 func validateIdentifier(name string) error {
 	if !validIdentifier.MatchString(name) {
@@ -875,15 +873,24 @@ outerLoop:
 	return schema, nil
 }
 
+// columnTypeClauseKeywords are the clauses that may trail a column type.
+var columnTypeClauseKeywords = [...]string{" DEFAULT", " CODEC", " COMMENT", " MATERIALIZED", " ALIAS"}
+
 // cleanColumnType removes trailing clauses from the column type.
 func cleanColumnType(colType string) string {
-	// Remove everything after DEFAULT, CODEC, COMMENT.
-	for _, keyword := range []string{" DEFAULT", " CODEC", " COMMENT", " MATERIALIZED", " ALIAS"} {
-		if idx := strings.Index(strings.ToUpper(colType), keyword); idx != -1 {
-			colType = colType[:idx]
+	// Remove everything after the first DEFAULT, CODEC, COMMENT, etc. The
+	// type is upper-cased once rather than once per keyword.
+	upper := strings.ToUpper(colType)
+	end := len(colType)
+
+	for _, keyword := range columnTypeClauseKeywords {
+		if idx := strings.Index(upper, keyword); idx != -1 && idx < end {
+			end = idx
 		}
 	}
 
+	colType = colType[:end]
+
 	// Remove trailing comma.
 	colType = strings.TrimSuffix(strings.TrimSpace(colType), ",")
 
@@ -67,3 +67,52 @@ func TestParseCreateTable_TableComment(t *testing.T) {
 		})
 	}
 }
+
+func TestGetTableAll_CaseInsensitiveFallback(t *testing.T) {
+	blocks := &TableSchema{Name: "fct_block_head"}
+	clusters := map[string]*ClusterTables{
+		"xatu-cbt": {
+			ClusterName: "xatu-cbt",
+			Tables:      map[string]*TableSchema{"fct_block_head": blocks},
+		},
+	}
+
+	c := &clickhouseSchemaClient{
+		clusters: clusters,
+		folded:   buildFoldedIndex(clusters),
+	}
+
+	exact := c.GetTableAll("fct_block_head")
+	require.Len(t, exact, 1)
+	assert.Same(t, blocks, exact[0].Schema)
+
+	folded := c.GetTableAll("FCT_Block_Head")
+	require.Len(t, folded, 1)
+	assert.Equal(t, "xatu-cbt", folded[0].ClusterName)
+	assert.Same(t, blocks, folded[0].Schema)
+
+	assert.Empty(t, c.GetTableAll("missing"))
+}
+
+func TestSystemTablesQuery_ExcludesSystemDatabases(t *testing.T) {
+	for db := range systemDatabaseBlacklist {
+		assert.Contains(t, systemTablesQuery, "'"+db+"'")
+	}
+
+	assert.Contains(t, systemTablesQuery, "SELECT database, name FROM system.tables")
+	assert.Contains(t, systemTablesQuery, "NOT endsWith(name, '_local')")
+}
+
+func TestCleanColumnType(t *testing.T) {
+	tests := map[string]string{
+		"UInt64,":                "UInt64",
+		"DateTime DEFAULT now()": "DateTime",
+		"String CODEC(ZSTD(1)) COMMENT 'default'":   "String",
+		"LowCardinality(String) comment 'x',":       "LowCardinality(String)",
+		"Nullable(String) ALIAS lower(x) DEFAULT y": "Nullable(String)",
+	}
+
+	for input, expected := range tests {
+		assert.Equal(t, expected, cleanColumnType(input), input)
+	}
+}
@@ -118,9 +118,13 @@ func (p *Module) PythonAPIDocs() map[string]types.ModuleDoc {
 				"get_base_url":         {Signature: "get_base_url(network) -> str", Description: "Get Dora base URL for a network"},
 				"get_network_overview": {Signature: "get_network_overview(network) -> dict", Description: "Get epoch, slot, validator counts"},
 				"get_validator":        {Signature: "get_validator(network, index_or_pubkey) -> dict", Description: "Get validator by index or pubkey"},
-				"get_validators":       {Signature: "get_validators(network, status=None, limit=100) -> list", Description: "List validators with optional filter"},
+				"get_validators":       {Signature: "get_validators(network, status=None, limit=100, offset=0) -> list", Description: "List validators with optional filter"},
+				"get_all_validators":   {Signature: "get_all_validators(network, total, status=None, page=100) -> list", Description: "List up to total validators, fetching pages concurrently"},
 				"get_slot":             {Signature: "get_slot(network, slot_or_hash) -> dict", Description: "Get slot by number or hash"},
 				"get_epoch":            {Signature: "get_epoch(network, epoch) -> dict", Description: "Get epoch summary"},
+				"get_slot_fields":      {Signature: "get_slot_fields(network, slot_or_hash, fields) -> dict", Description: "Get only the named top-level slot fields, streamed without decoding the full block"},
+				"get_slots":            {Signature: "get_slots(network, slots_or_hashes) -> dict[str, dict]", Description: "Get several slots concurrently, keyed by slot or hash"},
+				"get_epochs":           {Signature: "get_epochs(network, epochs) -> dict[int, dict]", Description: "Get several epoch summaries concurrently, keyed by epoch"},
 				"link_validator":       {Signature: "link_validator(network, index_or_pubkey) -> str", Description: "Deep link to validator"},
 				"link_slot":            {Signature: "link_slot(network, slot_or_hash) -> str", Description: "Deep link to slot"},
 				"link_epoch":           {Signature: "link_epoch(network, epoch) -> str", Description: "Deep link to epoch"},
@@ -2,29 +2,71 @@
 
 from __future__ import annotations
 
-import os
-from typing import Any
+import functools
+from typing import Any, Mapping
 
-from ethpandaops import _runtime
+from ethpandaops import _net, _runtime
+
+_NETWORKS_ENV = "ETHPANDAOPS_DORA_NETWORKS"
+
+
+def _networks() -> Mapping[str, str]:
+    # Network name -> Dora base URL (sorted, no trailing slash).
+    return _net.load(_NETWORKS_ENV)
+
+
+# Base URLs for networks missing from the environment, resolved through the
+# server once and memoized for the rest of the execution.
+_BASE_URLS: dict[str, str] = {}
+
+# Explorer deep link paths by kind, formatted locally against the cached
+# base URL rather than round-tripping through the server for every link.
+_LINK_PATHS: dict[str, str] = {
+    "validator": "/validator/{}",
+    "slot": "/slot/{}",
+    "epoch": "/epoch/{}",
+    "address": "/address/{}",
+    "block": "/block/{}",
+}
 
 
 def _require_dora_available() -> None:
-    if not os.environ.get("ETHPANDAOPS_DORA_NETWORKS", "").strip():
+    if not _networks():
         raise ValueError("Dora is not enabled or no Dora explorers are available.")
 
 
 def list_networks() -> list[dict[str, str]]:
     _require_dora_available()
-    data = _runtime.invoke_data("dora.list_networks")
-    return data.get("networks", [])
+    return _runtime.thaw_records(_net.records(_net.raw(_NETWORKS_ENV), "dora_url"))
 
 
 def get_base_url(network: str) -> str:
-    _require_dora_available()
+    # Environment first, then the server-resolved memo. Each step is a single
+    # EAFP lookup on hot link builders rather than a membership test plus index.
+    networks = _networks()
+    if not networks:
+        raise ValueError("Dora is not enabled or no Dora explorers are available.")
+    try:
+        return networks[network]
+    except KeyError:
+        pass
+    try:
+        return _BASE_URLS[network]
+    except KeyError:
+        pass
+
     data = _runtime.invoke_data("dora.get_base_url", {"network": network})
-    return data.get("base_url", "")
+    base_url = data.get("base_url", "").rstrip("/")
+    if base_url:
+        _BASE_URLS[network] = base_url
+    return base_url
+
 
+# Head-derived data moves on slot/epoch boundaries, so only cache it briefly.
+_HEAD_CACHE_TTL = 6.0
 
+
+@_runtime.ttl_cache(ttl=_HEAD_CACHE_TTL)
 def get_network_overview(network: str) -> dict[str, Any]:
     _require_dora_available()
     return _runtime.invoke_data("dora.get_network_overview", {"network": network})
@@ -42,18 +84,45 @@ def get_validator(network: str, index_or_pubkey: str) -> dict[str, Any]:
     return data if isinstance(data, dict) else {}
 
 
+def _data_list(payload: Any) -> list[dict[str, Any]]:
+    if not isinstance(payload, dict):
+        return []
+    data = payload.get("data")
+    return data if isinstance(data, list) else []
+
+
 def get_validators(
-    network: str, status: str | None = None, limit: int = 100
+    network: str, status: str | None = None, limit: int = 100, offset: int = 0
 ) -> list[dict[str, Any]]:
     _require_dora_available()
-    payload = _runtime.invoke_json(
+    return _data_list(
+        _runtime.invoke_json(
+            "dora.get_validators",
+            {"network": network, "status": status, "limit": limit, "offset": offset},
+        )
+    )
+
+
+def get_all_validators(
+    network: str, total: int, status: str | None = None, page: int = 100
+) -> list[dict[str, Any]]:
+    # Pages are requested concurrently and concatenated in offset order.
+    _require_dora_available()
+    if page <= 0:
+        raise ValueError("page must be positive")
+    payloads = _runtime.invoke_json_many(
         "dora.get_validators",
-        {"network": network, "status": status, "limit": limit},
+        [
+            {
+                "network": network,
+                "status": status,
+                "limit": min(page, total - offset),
+                "offset": offset,
+            }
+            for offset in range(0, total, page)
+        ],
     )
-    if not isinstance(payload, dict):
-        return []
-    data = payload.get("data")
-    return data if isinstance(data, list) else []
+    return [validator for payload in payloads for validator in _data_list(payload)]
 
 
 def get_slot(network: str, slot_or_hash: str) -> dict[str, Any]:
@@ -68,6 +137,7 @@ def get_slot(network: str, slot_or_hash: str) -> dict[str, Any]:
     return data if isinstance(data, dict) else {}
 
 
+@_runtime.ttl_cache(ttl=_HEAD_CACHE_TTL)
 def get_epoch(network: str, epoch: int) -> dict[str, Any]:
     _require_dora_available()
     payload = _runtime.invoke_json(
@@ -80,46 +150,78 @@ def get_epoch(network: str, epoch: int) -> dict[str, Any]:
     return data if isinstance(data, dict) else {}
 
 
-def link_validator(network: str, index_or_pubkey: str) -> str:
+def get_slot_fields(
+    network: str, slot_or_hash: str, fields: list[str]
+) -> dict[str, Any]:
+    # Slot payloads carry full attestation/deposit/transaction lists; stream
+    # them and keep only the requested top-level fields of "data".
     _require_dora_available()
-    data = _runtime.invoke_data(
-        "dora.link_validator",
-        {"network": network, "index_or_pubkey": index_or_pubkey},
+    return _runtime.invoke_json_fields(
+        "dora.get_slot",
+        {"network": network, "slot_or_hash": str(slot_or_hash)},
+        "data",
+        fields,
     )
-    return data.get("url", "")
 
 
-def link_slot(network: str, slot_or_hash: str) -> str:
+def _data_object(payload: Any) -> dict[str, Any]:
+    if not isinstance(payload, dict):
+        return {}
+    data = payload.get("data")
+    return data if isinstance(data, dict) else {}
+
+
+def get_slots(network: str, slots_or_hashes: list[str]) -> dict[str, dict[str, Any]]:
     _require_dora_available()
-    data = _runtime.invoke_data(
-        "dora.link_slot",
-        {"network": network, "slot_or_hash": slot_or_hash},
+    payloads = _runtime.invoke_json_many(
+        "dora.get_slot",
+        [
+            {"network": network, "slot_or_hash": str(slot_or_hash)}
+            for slot_or_hash in slots_or_hashes
+        ],
     )
-    return data.get("url", "")
+    return {
+        str(slot_or_hash): _data_object(payload)
+        for slot_or_hash, payload in zip(slots_or_hashes, payloads)
+    }
 
 
-def link_epoch(network: str, epoch: int) -> str:
+def get_epochs(network: str, epochs: list[int]) -> dict[int, dict[str, Any]]:
     _require_dora_available()
-    data = _runtime.invoke_data(
-        "dora.link_epoch",
-        {"network": network, "epoch": str(epoch)},
+    payloads = _runtime.invoke_json_many(
+        "dora.get_epoch",
+        [{"network": network, "epoch": str(epoch)} for epoch in epochs],
     )
-    return data.get("url", "")
+    return {epoch: _data_object(payload) for epoch, payload in zip(epochs, payloads)}
+
+
+@functools.lru_cache(maxsize=64)
+def _link_templates(base_url: str) -> dict[str, str]:
+    # Full per-network URL templates, so each link is a single format call.
+    return {kind: base_url + path for kind, path in _LINK_PATHS.items()}
+
+
+def _link(network: str, kind: str, identifier: str) -> str:
+    if not identifier:
+        raise ValueError("identifier is required")
+    return _link_templates(get_base_url(network))[kind].format(identifier)
+
+
+def link_validator(network: str, index_or_pubkey: str) -> str:
+    return _link(network, "validator", index_or_pubkey)
+
+
+def link_slot(network: str, slot_or_hash: str) -> str:
+    return _link(network, "slot", slot_or_hash)
+
+
+def link_epoch(network: str, epoch: int) -> str:
+    return _link(network, "epoch", str(epoch))
 
 
 def link_address(network: str, address: str) -> str:
-    _require_dora_available()
-    data = _runtime.invoke_data(
-        "dora.link_address",
-        {"network": network, "address": address},
-    )
-    return data.get("url", "")
+    return _link(network, "address", address)
 
 
 def link_block(network: str, number_or_hash: str) -> str:
-    _require_dora_available()
-    data = _runtime.invoke_data(
-        "dora.link_block",
-        {"network": network, "number_or_hash": number_or_hash},
-    )
-    return data.get("url", "")
+    return _link(network, "block", number_or_hash)
@@ -91,6 +91,9 @@ func (p *Module) PythonAPIDocs() map[string]types.ModuleDoc {
 				"get_node_version":         {Signature: "get_node_version(network, instance) -> dict", Description: "Get beacon node software version"},
 				"get_node_syncing":         {Signature: "get_node_syncing(network, instance) -> dict", Description: "Get beacon node sync status"},
 				"get_node_health":          {Signature: "get_node_health(network, instance) -> int", Description: "Get beacon node health status code"},
+				"get_node_version_many":    {Signature: "get_node_version_many(network, instances) -> dict[str, dict]", Description: "Get beacon node versions for several instances concurrently"},
+				"get_node_syncing_many":    {Signature: "get_node_syncing_many(network, instances) -> dict[str, dict]", Description: "Get beacon node sync status for several instances concurrently"},
+				"get_node_health_many":     {Signature: "get_node_health_many(network, instances) -> dict[str, int]", Description: "Get beacon node health status codes for several instances concurrently"},
 				"get_peers":                {Signature: "get_peers(network, instance) -> dict", Description: "Get connected peers list"},
 				"get_peer_count":           {Signature: "get_peer_count(network, instance) -> dict", Description: "Get peer count summary"},
 				"get_beacon_headers":       {Signature: "get_beacon_headers(network, instance, slot='head') -> dict", Description: "Get beacon block header"},
@@ -7,9 +7,13 @@ from typing import Any
 
 from ethpandaops import _runtime
 
+# The sandbox environment is fixed for the life of an execution, so read the
+# availability flag once rather than on every call.
+_ETHNODE_AVAILABLE = bool(os.environ.get("ETHPANDAOPS_ETHNODE_AVAILABLE", "").strip())
+
 
 def _require_ethnode_available() -> None:
-    if not os.environ.get("ETHPANDAOPS_ETHNODE_AVAILABLE", "").strip():
+    if not _ETHNODE_AVAILABLE:
         raise ValueError("Ethnode is not enabled or no node access is available.")
 
 
@@ -80,6 +84,23 @@ def get_node_version(network: str, instance: str) -> dict[str, Any]:
     )
 
 
+def _invoke_per_instance(
+    operation: str, network: str, instances: list[str]
+) -> dict[str, Any]:
+    _require_ethnode_available()
+    results = _runtime.invoke_data_many(
+        operation,
+        [{"network": network, "instance": instance} for instance in instances],
+    )
+    return dict(zip(instances, results))
+
+
+def get_node_version_many(
+    network: str, instances: list[str]
+) -> dict[str, dict[str, Any]]:
+    return _invoke_per_instance("ethnode.get_node_version", network, instances)
+
+
 def get_node_syncing(network: str, instance: str) -> dict[str, Any]:
     _require_ethnode_available()
     return _runtime.invoke_data(
@@ -88,6 +109,12 @@ def get_node_syncing(network: str, instance: str) -> dict[str, Any]:
     )
 
 
+def get_node_syncing_many(
+    network: str, instances: list[str]
+) -> dict[str, dict[str, Any]]:
+    return _invoke_per_instance("ethnode.get_node_syncing", network, instances)
+
+
 def get_node_health(network: str, instance: str) -> int:
     _require_ethnode_available()
     data = _runtime.invoke_data(
@@ -97,6 +124,11 @@ def get_node_health(network: str, instance: str) -> int:
     return data.get("status_code", 0)
 
 
+def get_node_health_many(network: str, instances: list[str]) -> dict[str, int]:
+    results = _invoke_per_instance("ethnode.get_node_health", network, instances)
+    return {instance: data.get("status_code", 0) for instance, data in results.items()}
+
+
 def get_peers(network: str, instance: str) -> dict[str, Any]:
     _require_ethnode_available()
     return _runtime.invoke_data(
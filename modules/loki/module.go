@@ -176,6 +176,19 @@ func (p *Module) PythonAPIDocs() map[string]types.ModuleDoc {
 					},
 					Returns: "Dict with Loki stream/vector data under 'resultType' and 'result'",
 				},
+				"query_df": {
+					Signature:   "loki.query_df(datasource: str, logql: str, limit: int = 100, start: str = None, end: str = None, direction: str = 'backward') -> pandas.DataFrame",
+					Description: "Execute LogQL range query and flatten log streams into one row per line",
+					Parameters: map[string]string{
+						"datasource": "Datasource name",
+						"logql":      "LogQL log query string",
+						"limit":      "Max entries to return (default: 100)",
+						"start":      "Start time (default: now-1h)",
+						"end":        "End time (default: now)",
+						"direction":  "'forward' or 'backward' (default)",
+					},
+					Returns: "DataFrame with 'timestamp' (UTC), 'line' and 'labels' (stream label dict) columns",
+				},
 				"query_instant": {
 					Signature:   "loki.query_instant(datasource: str, logql: str, time: str = None, limit: int = 100, direction: str = 'backward') -> dict",
 					Description: "Execute instant LogQL query and return the raw Loki data payload",
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, Mapping
 
 from ethpandaops import _runtime
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def list_datasources() -> list[dict[str, Any]]:
+
+@_runtime.ttl_cache
+def _datasources_snapshot() -> tuple[Mapping[str, Any], ...]:
     data = _runtime.invoke_data("loki.list_datasources")
-    return data.get("datasources", [])
+    return _runtime.freeze_records(data.get("datasources", []))
+
+
+def list_datasources() -> list[dict[str, Any]]:
+    return _runtime.thaw_records(_datasources_snapshot())
 
 
 def query(
@@ -34,6 +42,49 @@ def query(
     return data if isinstance(data, dict) else {}
 
 
+def _streams_dataframe(data: dict[str, Any]) -> pd.DataFrame:
+    # One pass over the streams into three parallel columns; each distinct
+    # label set is stored once and shared by every line of every stream that
+    # carries it, instead of one dict per stream (or per line).
+    import pandas as pd
+
+    if data.get("resultType", "streams") != "streams":
+        raise ValueError("query_df only supports log queries; use query() for metrics")
+
+    timestamps: list[int] = []
+    lines: list[str] = []
+    labels: list[dict[str, str]] = []
+    interned: dict[frozenset[tuple[str, str]], dict[str, str]] = {}
+    for stream in data.get("result") or ():
+        values = stream.get("values") or ()
+        stream_labels = stream.get("stream") or {}
+        stream_labels = interned.setdefault(
+            frozenset(stream_labels.items()), stream_labels
+        )
+        timestamps.extend(int(value[0]) for value in values)
+        lines.extend(value[1] for value in values)
+        labels.extend([stream_labels] * len(values))
+
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(timestamps, unit="ns", utc=True),
+            "line": lines,
+            "labels": labels,
+        }
+    )
+
+
+def query_df(
+    instance_name: str,
+    logql: str,
+    limit: int = 100,
+    start: str | None = None,
+    end: str | None = None,
+    direction: str = "backward",
+) -> pd.DataFrame:
+    return _streams_dataframe(query(instance_name, logql, limit, start, end, direction))
+
+
 def query_instant(
     instance_name: str,
     logql: str,
@@ -202,6 +202,14 @@ func (p *Module) PythonAPIDocs() map[string]types.ModuleDoc {
 					},
 					Returns: "List of label values",
 				},
+				"get_label_index": {
+					Signature:   "prometheus.get_label_index(datasource: str) -> dict[str, list[str]]",
+					Description: "Get every label with its values in one call. Values are fetched concurrently and cached; use ethpandaops.clear_cache() to refresh",
+					Parameters: map[string]string{
+						"datasource": "Datasource name",
+					},
+					Returns: "Dict mapping label name to its values",
+				},
 			},
 		},
 	}
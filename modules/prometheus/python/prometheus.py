@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from ethpandaops import _runtime
 
 
-def list_datasources() -> list[dict[str, Any]]:
+@_runtime.ttl_cache
+def _datasources_snapshot() -> tuple[Mapping[str, Any], ...]:
     data = _runtime.invoke_data("prometheus.list_datasources")
-    return data.get("datasources", [])
+    return _runtime.freeze_records(data.get("datasources", []))
+
+
+def list_datasources() -> list[dict[str, Any]]:
+    return _runtime.thaw_records(_datasources_snapshot())
 
 
 def query(
@@ -60,3 +66,26 @@ def get_label_values(instance_name: str, label: str) -> list[str]:
         {"datasource": instance_name, "label": label},
     )
     return data if isinstance(data, list) else []
+
+
+@_runtime.ttl_cache
+def _label_index_snapshot(instance_name: str) -> Mapping[str, tuple[str, ...]]:
+    labels = get_labels(instance_name)
+    # One concurrent fan-out instead of a get_label_values round trip per label.
+    values = _runtime.invoke_json_data_many(
+        "prometheus.get_label_values",
+        [{"datasource": instance_name, "label": label} for label in labels],
+    )
+    return MappingProxyType(
+        {
+            label: tuple(data) if isinstance(data, list) else ()
+            for label, data in zip(labels, values)
+        }
+    )
+
+
+def get_label_index(instance_name: str) -> dict[str, list[str]]:
+    return {
+        label: list(values)
+        for label, values in _label_index_snapshot(instance_name).items()
+    }
@@ -6,6 +6,7 @@ import (
 	"context"
 	"errors"
 	"fmt"
+	"path/filepath"
 	"strings"
 
 	"github.com/sirupsen/logrus"
@@ -89,7 +90,8 @@ func (a *App) Build(ctx context.Context) error {
 		return fmt.Errorf("initializing modules: %w", err)
 	}
 
-	// 5. Inject proxy client into modules and start all modules.
+	// 5. Inject logger and proxy client into modules and start all modules.
+	a.injectLogger()
 	a.injectProxyClient()
 
 	if err := a.ModuleRegistry.StartAll(ctx); err != nil {
@@ -101,11 +103,17 @@ func (a *App) Build(ctx context.Context) error {
 	a.log.Info("All modules started")
 
 	// 6. Create and start cartographoor client.
-	cartographoorClient := cartographoor.NewCartographoorClient(a.log, cartographoor.CartographoorConfig{
+	cartographoorCfg := cartographoor.CartographoorConfig{
 		URL:      cartographoor.DefaultCartographoorURL,
 		CacheTTL: cartographoor.DefaultCacheTTL,
 		Timeout:  cartographoor.DefaultHTTPTimeout,
-	})
+	}
+
+	if a.cfg.Storage.CacheDir != "" {
+		cartographoorCfg.CachePath = filepath.Join(a.cfg.Storage.CacheDir, cartographoor.DefaultCacheFileName)
+	}
+
+	cartographoorClient := cartographoor.NewCartographoorClient(a.log, cartographoorCfg)
 
 	if err := cartographoorClient.Start(ctx); err != nil {
 		a.stop(ctx)
@@ -233,6 +241,14 @@ func (a *App) buildProxyClient() proxy.Client {
 	return proxy.NewClient(a.log, cfg)
 }
 
+func (a *App) injectLogger() {
+	for _, ext := range a.ModuleRegistry.Initialized() {
+		if aware, ok := ext.(module.LoggerAware); ok {
+			aware.SetLogger(a.log)
+		}
+	}
+}
+
 func (a *App) injectProxyClient() {
 	for _, ext := range a.ModuleRegistry.Initialized() {
 		if aware, ok := ext.(module.ProxyAware); ok {
@@ -11,10 +11,13 @@
 package auth
 
 import (
+	"container/heap"
 	"context"
 	"crypto/rand"
 	"crypto/sha256"
+	"crypto/subtle"
 	"encoding/base64"
+	"encoding/hex"
 	"encoding/json"
 	"fmt"
 	"html"
@@ -50,8 +53,43 @@ const (
 	// userCodeAlphabet is uppercase consonants only (no vowels to avoid offensive words).
 	userCodeAlphabet = "BCDFGHJKLMNPQRSTVWXZ"
 
+	// maxAccessTokenLen bounds bearer tokens accepted for parsing. Issued
+	// access tokens are far shorter.
+	maxAccessTokenLen = 4096
+
+	// maxCachedClaims bounds the validated access token cache.
+	maxCachedClaims = 10000
+
+	// githubUserCacheTTL is how long a refresh grant reuses a GitHub profile
+	// and org lookup for the same GitHub user and access token. Membership
+	// changes take effect on refresh within this window.
+	githubUserCacheTTL = time.Minute
+
+	// maxCachedGitHubUsers bounds the GitHub user lookup cache.
+	maxCachedGitHubUsers = 4096
+
 	// userCodeHalfLen is the number of characters per half of the XXXX-XXXX user code.
 	userCodeHalfLen = 4
+
+	// deviceCodeGrantType is the RFC 8628 device authorization grant type.
+	deviceCodeGrantType = "urn:ietf:params:oauth:grant-type:device_code"
+
+	// pkceMethodS256 is the only supported PKCE code challenge method.
+	pkceMethodS256 = "S256"
+
+	// githubScope is the GitHub OAuth scope needed to read the user and their orgs.
+	githubScope = "read:user read:org"
+)
+
+// Capability lists advertised by the discovery metadata. They are shared by
+// both documents and never mutated.
+var (
+	supportedScopes               = []string{"mcp"}
+	supportedBearerMethods        = []string{"header"}
+	supportedResponseTypes        = []string{"code"}
+	supportedGrantTypes           = []string{"authorization_code", "refresh_token", deviceCodeGrantType}
+	supportedCodeChallengeMethods = []string{pkceMethodS256}
+	supportedTokenAuthMethods     = []string{"none"}
 )
 
 type githubClient interface {
@@ -76,6 +114,7 @@ type simpleService struct {
 	github          githubClient
 	secretKey       []byte
 	allowedOrgs     []string
+	allowedOrgSet   map[string]struct{}
 	issuerURL       string
 	accessTokenTTL  time.Duration
 	refreshTokenTTL time.Duration
@@ -97,6 +136,36 @@ type simpleService struct {
 	refreshSessions   map[string]*refreshSession
 	refreshSessionsMu sync.RWMutex
 
+	// Validated access token claims (token -> claims), kept until expiry so
+	// repeat requests skip signature verification and claims decoding.
+	// claimsExpiry orders the same tokens by expiry for eviction.
+	claimsCache   map[string]*tokenClaims
+	claimsExpiry  claimsExpiryHeap
+	claimsCacheMu sync.RWMutex
+
+	// GitHub user lookups (GitHub user ID and sha256 of GitHub access token
+	// -> user), reused for a short window so refresh grants do not re-query
+	// /user and /user/orgs.
+	githubUsers   map[githubUserKey]*cachedGitHubUser
+	githubUsersMu sync.Mutex
+
+	// Discovery metadata bodies. They depend only on the issuer URL, which is
+	// fixed at construction, so they are rendered once.
+	resourceMetadata *metadataDocument
+	serverMetadata   *metadataDocument
+
+	// tokenParser validates access tokens. Its options depend only on the
+	// issuer URL, so it is built once.
+	tokenParser *jwt.Parser
+
+	// invalidTokenChallenge is the WWW-Authenticate value for 401 responses
+	// up to the error description, which is the only part that varies.
+	invalidTokenChallenge string
+
+	// unauthorizedResponses holds the rendered header and body for each of
+	// the middleware's fixed 401 descriptions.
+	unauthorizedResponses map[string]unauthorizedResponse
+
 	// Lifecycle.
 	stopCh chan struct{}
 }
@@ -199,6 +268,7 @@ func NewSimpleService(log logrus.FieldLogger, cfg Config) (SimpleService, error)
 		github:          github.NewClient(log, cfg.GitHub.ClientID, cfg.GitHub.ClientSecret),
 		secretKey:       []byte(cfg.Tokens.SecretKey),
 		allowedOrgs:     cfg.AllowedOrgs,
+		allowedOrgSet:   newOrgSet(cfg.AllowedOrgs),
 		issuerURL:       cfg.IssuerURL,
 		accessTokenTTL:  cfg.AccessTokenTTL,
 		refreshTokenTTL: cfg.RefreshTokenTTL,
@@ -207,9 +277,36 @@ func NewSimpleService(log logrus.FieldLogger, cfg Config) (SimpleService, error)
 		devices:         make(map[string]*deviceAuth, 16),
 		userCodes:       make(map[string]string, 16),
 		refreshSessions: make(map[string]*refreshSession, 32),
+		claimsCache:     make(map[string]*tokenClaims, 64),
+		githubUsers:     make(map[githubUserKey]*cachedGitHubUser, 32),
 		stopCh:          make(chan struct{}),
 	}
 
+	s.tokenParser = jwt.NewParser(
+		jwt.WithValidMethods([]string{jwt.SigningMethodHS256.Alg()}),
+		jwt.WithIssuer(s.issuerURL),
+		jwt.WithExpirationRequired(),
+	)
+
+	s.invalidTokenChallenge = fmt.Sprintf(
+		`Bearer resource_metadata="%s/.well-known/oauth-protected-resource", error="invalid_token", error_description="`,
+		s.issuerURL)
+
+	s.unauthorizedResponses = make(map[string]unauthorizedResponse, len(unauthorizedDescriptions))
+	for _, description := range unauthorizedDescriptions {
+		s.unauthorizedResponses[description] = s.renderUnauthorized(description)
+	}
+
+	var err error
+
+	if s.resourceMetadata, err = encodeMetadata(resourceMetadata(s.issuerURL)); err != nil {
+		return nil, fmt.Errorf("encoding resource metadata: %w", err)
+	}
+
+	if s.serverMetadata, err = encodeMetadata(serverMetadata(s.issuerURL)); err != nil {
+		return nil, fmt.Errorf("encoding server metadata: %w", err)
+	}
+
 	log.WithFields(logrus.Fields{
 		"allowed_orgs": cfg.AllowedOrgs,
 	}).Info("Auth service created")
@@ -270,76 +367,42 @@ func (s *simpleService) Middleware() func(http.Handler) http.Handler {
 		return func(next http.Handler) http.Handler { return next }
 	}
 
-	publicPaths := map[string]bool{
-		"/":                                     true,
-		"/health":                               true,
-		"/ready":                                true,
-		"/.well-known/oauth-protected-resource": true,
-		"/.well-known/oauth-authorization-server": true,
-	}
-
-	publicPrefixes := []string{"/auth/", "/.well-known/"}
-
 	return func(next http.Handler) http.Handler {
 		return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
 			// Skip public paths.
-			if publicPaths[r.URL.Path] {
+			if isPublicPath(r.URL.Path) {
 				next.ServeHTTP(w, r)
 				return
 			}
-			for _, prefix := range publicPrefixes {
-				if strings.HasPrefix(r.URL.Path, prefix) {
-					next.ServeHTTP(w, r)
-					return
-				}
-			}
 
 			// Get token from Authorization header.
-			authHeader := r.Header.Get("Authorization")
-			if !strings.HasPrefix(authHeader, "Bearer ") {
-				baseURL := s.issuerURL
-				s.writeUnauthorized(w, baseURL, "missing or invalid Authorization header")
+			tokenStr, ok := bearerToken(r.Header.Get("Authorization"))
+			if !ok {
+				s.writeUnauthorized(w, descMissingBearer)
 				return
 			}
 
-			tokenStr := strings.TrimPrefix(authHeader, "Bearer ")
-			baseURL := s.issuerURL
-
-			// Validate token.
-			claims := &tokenClaims{}
-			token, err := jwt.ParseWithClaims(tokenStr, claims, func(t *jwt.Token) (any, error) {
-				if t.Method.Alg() != jwt.SigningMethodHS256.Alg() {
-					return nil, fmt.Errorf("unexpected signing method")
+			// Tokens already validated are served from the cache until they expire.
+			claims, ok := s.cachedClaims(tokenStr)
+			if !ok {
+				var reason string
+				if claims, reason = s.validateAccessToken(tokenStr); claims == nil {
+					s.writeUnauthorized(w, reason)
+					return
 				}
-				return s.secretKey, nil
-			}, jwt.WithIssuer(baseURL), jwt.WithExpirationRequired())
 
-			if err != nil || !token.Valid {
-				s.writeUnauthorized(w, baseURL, "invalid token")
-				return
+				s.storeClaims(tokenStr, claims)
 			}
 
-			// Validate audience (RFC 8707).
-			audienceValid := false
-			for _, aud := range claims.Audience {
-				if aud == baseURL {
-					audienceValid = true
-					break
-				}
-			}
-			if !audienceValid {
-				s.writeUnauthorized(w, baseURL, "token audience mismatch")
-				return
-			}
-
-			// Attach user info to context.
+			// Attach user info to context. Slices are copied so handlers
+			// never share state with the cached claims.
 			ctx := context.WithValue(r.Context(), authUserKey, &AuthUser{
 				Subject:     claims.Subject,
 				Username:    claims.GitHubLogin,
 				Groups:      append([]string(nil), claims.Orgs...),
 				GitHubLogin: claims.GitHubLogin,
 				GitHubID:    claims.GitHubID,
-				Orgs:        claims.Orgs,
+				Orgs:        append([]string(nil), claims.Orgs...),
 			})
 
 			next.ServeHTTP(w, r.WithContext(ctx))
@@ -347,6 +410,231 @@ func (s *simpleService) Middleware() func(http.Handler) http.Handler {
 	}
 }
 
+// validateAccessToken verifies an access token's signature, issuer, expiry
+// and audience. On failure it returns nil claims and the 401 description.
+func (s *simpleService) validateAccessToken(tokenStr string) (*tokenClaims, string) {
+	// Reject values that cannot be a compact JWS before decoding anything.
+	if len(tokenStr) > maxAccessTokenLen || strings.Count(tokenStr, ".") != 2 {
+		return nil, descInvalidToken
+	}
+
+	claims := &tokenClaims{}
+
+	token, err := s.tokenParser.ParseWithClaims(tokenStr, claims, s.accessTokenKey)
+	if err != nil || !token.Valid {
+		return nil, descInvalidToken
+	}
+
+	// Validate audience (RFC 8707).
+	for _, aud := range claims.Audience {
+		if aud == s.issuerURL {
+			return claims, ""
+		}
+	}
+
+	return nil, descAudienceMismatch
+}
+
+// accessTokenKey is the jwt.Keyfunc for access tokens. Signing methods are
+// restricted by tokenParser.
+func (s *simpleService) accessTokenKey(*jwt.Token) (any, error) {
+	return s.secretKey, nil
+}
+
+// cachedClaims returns previously validated claims for an unexpired token.
+func (s *simpleService) cachedClaims(token string) (*tokenClaims, bool) {
+	s.claimsCacheMu.RLock()
+	claims, ok := s.claimsCache[token]
+	s.claimsCacheMu.RUnlock()
+
+	if !ok || !time.Now().Before(claims.ExpiresAt.Time) {
+		return nil, false
+	}
+
+	return claims, true
+}
+
+// storeClaims caches validated claims. When the cache is full, expired
+// entries are dropped first; if it is still full the token closest to
+// expiry is evicted to make room, so new sessions are always cached.
+func (s *simpleService) storeClaims(token string, claims *tokenClaims) {
+	s.claimsCacheMu.Lock()
+	defer s.claimsCacheMu.Unlock()
+
+	if _, ok := s.claimsCache[token]; ok {
+		return
+	}
+
+	if len(s.claimsCache) >= maxCachedClaims {
+		s.evictExpiredClaims(time.Now())
+
+		for len(s.claimsCache) >= maxCachedClaims {
+			entry := heap.Pop(&s.claimsExpiry).(claimsExpiryEntry)
+			delete(s.claimsCache, entry.token)
+		}
+	}
+
+	s.claimsCache[token] = claims
+	heap.Push(&s.claimsExpiry, claimsExpiryEntry{token: token, expiresAt: claims.ExpiresAt.Time})
+}
+
+// evictExpiredClaims removes expired tokens, popping only the expired
+// entries off the expiry heap. Callers must hold claimsCacheMu.
+func (s *simpleService) evictExpiredClaims(now time.Time) {
+	for len(s.claimsExpiry) > 0 && !now.Before(s.claimsExpiry[0].expiresAt) {
+		entry := heap.Pop(&s.claimsExpiry).(claimsExpiryEntry)
+		delete(s.claimsCache, entry.token)
+	}
+}
+
+// claimsExpiryEntry is a cached token and its expiry.
+type claimsExpiryEntry struct {
+	token     string
+	expiresAt time.Time
+}
+
+// claimsExpiryHeap is a min-heap of cached tokens ordered by expiry.
+type claimsExpiryHeap []claimsExpiryEntry
+
+func (h claimsExpiryHeap) Len() int           { return len(h) }
+func (h claimsExpiryHeap) Less(i, j int) bool { return h[i].expiresAt.Before(h[j].expiresAt) }
+func (h claimsExpiryHeap) Swap(i, j int)      { h[i], h[j] = h[j], h[i] }
+
+func (h *claimsExpiryHeap) Push(x any) { *h = append(*h, x.(claimsExpiryEntry)) }
+
+func (h *claimsExpiryHeap) Pop() any {
+	old := *h
+	entry := old[len(old)-1]
+	*h = old[:len(old)-1]
+
+	return entry
+}
+
+// githubUserKey identifies a cached GitHub lookup. Each refresh session holds
+// its own GitHub token, so a lookup only vouches for the token it was made with.
+type githubUserKey struct {
+	githubID  int64
+	tokenHash [sha256.Size]byte
+}
+
+// cachedGitHubUser is a GitHub user lookup with its cache expiry.
+type cachedGitHubUser struct {
+	user      *github.GitHubUser
+	expiresAt time.Time
+}
+
+// refreshGitHubUser returns the GitHub profile and orgs for a refresh
+// session, reusing a lookup for the same GitHub user and access token made
+// within githubUserCacheTTL. Logins always query GitHub directly: each one
+// brings a fresh token and must see current membership.
+func (s *simpleService) refreshGitHubUser(ctx context.Context, githubID int64, accessToken string) (*github.GitHubUser, error) {
+	key := githubUserKey{githubID: githubID, tokenHash: sha256.Sum256([]byte(accessToken))}
+	now := time.Now()
+
+	s.githubUsersMu.Lock()
+	cached, ok := s.githubUsers[key]
+	s.githubUsersMu.Unlock()
+
+	if ok && now.Before(cached.expiresAt) {
+		return cached.user, nil
+	}
+
+	user, err := s.github.GetUser(ctx, accessToken)
+	if err != nil {
+		// Any failure, including a 401/403 for a revoked or de-scoped token,
+		// drops the lookup so the next refresh asks GitHub again.
+		s.githubUsersMu.Lock()
+		delete(s.githubUsers, key)
+		s.githubUsersMu.Unlock()
+
+		return nil, err
+	}
+
+	// A token that now resolves to another user is rejected by the caller;
+	// never cache it under this session's user.
+	if user.ID != githubID {
+		return user, nil
+	}
+
+	s.githubUsersMu.Lock()
+	defer s.githubUsersMu.Unlock()
+
+	if len(s.githubUsers) >= maxCachedGitHubUsers {
+		s.evictExpiredGitHubUsers(now)
+	}
+
+	if len(s.githubUsers) < maxCachedGitHubUsers {
+		s.githubUsers[key] = &cachedGitHubUser{user: user, expiresAt: now.Add(githubUserCacheTTL)}
+	}
+
+	return user, nil
+}
+
+// evictExpiredGitHubUsers removes expired lookups. Callers must hold
+// githubUsersMu.
+func (s *simpleService) evictExpiredGitHubUsers(now time.Time) {
+	for key, cached := range s.githubUsers {
+		if !now.Before(cached.expiresAt) {
+			delete(s.githubUsers, key)
+		}
+	}
+}
+
+// publicPaths are served without a bearer token. Discovery documents are
+// covered by the /.well-known/ prefix.
+var publicPaths = map[string]struct{}{
+	"/":       {},
+	"/health": {},
+	"/ready":  {},
+}
+
+// publicPathPrefixes are path prefixes served without a bearer token.
+var publicPathPrefixes = [...]string{"/auth/", "/.well-known/"}
+
+// isPublicPath reports whether path bypasses bearer token validation.
+func isPublicPath(path string) bool {
+	if _, ok := publicPaths[path]; ok {
+		return true
+	}
+
+	for _, prefix := range publicPathPrefixes {
+		if strings.HasPrefix(path, prefix) {
+			return true
+		}
+	}
+
+	return false
+}
+
+// bearerPrefix is the Authorization scheme prefix for bearer tokens.
+const bearerPrefix = "Bearer "
+
+// bearerToken extracts the token from an Authorization header. The scheme
+// is matched case-insensitively per RFC 6750.
+func bearerToken(header string) (string, bool) {
+	if len(header) <= len(bearerPrefix) || !strings.EqualFold(header[:len(bearerPrefix)], bearerPrefix) {
+		return "", false
+	}
+
+	return header[len(bearerPrefix):], true
+}
+
+// newOrgSet builds a lookup set from the configured allowed organizations.
+func newOrgSet(orgs []string) map[string]struct{} {
+	set := make(map[string]struct{}, len(orgs))
+	for _, org := range orgs {
+		set[org] = struct{}{}
+	}
+
+	return set
+}
+
+// isAllowedMember reports whether the user belongs to at least one allowed
+// organization. With no allowed organizations configured, everyone passes.
+func (s *simpleService) isAllowedMember(user *github.GitHubUser) bool {
+	return user.IsMemberOfAny(s.allowedOrgSet)
+}
+
 // AuthUser is the authenticated user info attached to request context.
 type AuthUser struct {
 	Subject     string
@@ -410,50 +698,146 @@ func (s *simpleService) cleanup() {
 	}
 	s.devicesMu.Unlock()
 
-	s.refreshSessionsMu.Lock()
+	// Refresh sessions are the largest map and live for weeks, so the scan
+	// runs under the read lock and the write lock is held only to delete
+	// what expired, keeping concurrent refresh grants unblocked.
+	var expired []string
+
+	s.refreshSessionsMu.RLock()
 	for key, session := range s.refreshSessions {
 		if now.After(session.ExpiresAt) {
-			delete(s.refreshSessions, key)
+			expired = append(expired, key)
 		}
 	}
-	s.refreshSessionsMu.Unlock()
+	s.refreshSessionsMu.RUnlock()
+
+	if len(expired) > 0 {
+		s.refreshSessionsMu.Lock()
+		for _, key := range expired {
+			if session, ok := s.refreshSessions[key]; ok && now.After(session.ExpiresAt) {
+				delete(s.refreshSessions, key)
+			}
+		}
+		s.refreshSessionsMu.Unlock()
+	}
+
+	s.claimsCacheMu.Lock()
+	s.evictExpiredClaims(now)
+	s.claimsCacheMu.Unlock()
+
+	s.githubUsersMu.Lock()
+	s.evictExpiredGitHubUsers(now)
+	s.githubUsersMu.Unlock()
 }
 
-// handleResourceMetadata returns RFC 9728 protected resource metadata.
-func (s *simpleService) handleResourceMetadata(w http.ResponseWriter, r *http.Request) {
-	baseURL := s.issuerURL
+// protectedResourceMetadata is the RFC 9728 protected resource metadata document.
+type protectedResourceMetadata struct {
+	Resource               string   `json:"resource"`
+	AuthorizationServers   []string `json:"authorization_servers"`
+	BearerMethodsSupported []string `json:"bearer_methods_supported"`
+	ScopesSupported        []string `json:"scopes_supported"`
+}
+
+// authorizationServerMetadata is the RFC 8414 authorization server metadata document.
+type authorizationServerMetadata struct {
+	Issuer                            string   `json:"issuer"`
+	AuthorizationEndpoint             string   `json:"authorization_endpoint"`
+	TokenEndpoint                     string   `json:"token_endpoint"`
+	DeviceAuthorizationEndpoint       string   `json:"device_authorization_endpoint"`
+	ResponseTypesSupported            []string `json:"response_types_supported"`
+	GrantTypesSupported               []string `json:"grant_types_supported"`
+	CodeChallengeMethodsSupported     []string `json:"code_challenge_methods_supported"`
+	TokenEndpointAuthMethodsSupported []string `json:"token_endpoint_auth_methods_supported"`
+	ScopesSupported                   []string `json:"scopes_supported"`
+}
 
-	metadata := map[string]any{
-		"resource":                 baseURL,
-		"authorization_servers":    []string{baseURL},
-		"bearer_methods_supported": []string{"header"},
-		"scopes_supported":         []string{"mcp"},
+// resourceMetadata builds RFC 9728 protected resource metadata.
+func resourceMetadata(baseURL string) *protectedResourceMetadata {
+	return &protectedResourceMetadata{
+		Resource:               baseURL,
+		AuthorizationServers:   []string{baseURL},
+		BearerMethodsSupported: supportedBearerMethods,
+		ScopesSupported:        supportedScopes,
 	}
+}
 
-	w.Header().Set("Content-Type", "application/json")
-	w.Header().Set("Cache-Control", "max-age=3600")
-	_ = json.NewEncoder(w).Encode(metadata)
+// serverMetadata builds RFC 8414 authorization server metadata.
+func serverMetadata(baseURL string) *authorizationServerMetadata {
+	return &authorizationServerMetadata{
+		Issuer:                            baseURL,
+		AuthorizationEndpoint:             baseURL + "/auth/authorize",
+		TokenEndpoint:                     baseURL + "/auth/token",
+		DeviceAuthorizationEndpoint:       baseURL + "/auth/device/code",
+		ResponseTypesSupported:            supportedResponseTypes,
+		GrantTypesSupported:               supportedGrantTypes,
+		CodeChallengeMethodsSupported:     supportedCodeChallengeMethods,
+		TokenEndpointAuthMethodsSupported: supportedTokenAuthMethods,
+		ScopesSupported:                   supportedScopes,
+	}
+}
+
+// metadataDocument is a discovery document encoded once, with a strong ETag
+// so clients can revalidate with If-None-Match instead of refetching.
+type metadataDocument struct {
+	body []byte
+	etag string
+}
+
+// encodeMetadata renders a metadata document as served, newline-terminated
+// like json.Encoder output.
+func encodeMetadata(metadata any) (*metadataDocument, error) {
+	body, err := json.Marshal(metadata)
+	if err != nil {
+		return nil, err
+	}
+
+	body = append(body, '\n')
+	sum := sha256.Sum256(body)
+
+	return &metadataDocument{
+		body: body,
+		etag: `"` + hex.EncodeToString(sum[:16]) + `"`,
+	}, nil
+}
+
+// handleResourceMetadata returns RFC 9728 protected resource metadata.
+func (s *simpleService) handleResourceMetadata(w http.ResponseWriter, r *http.Request) {
+	writeMetadata(w, r, s.resourceMetadata)
 }
 
 // handleServerMetadata returns RFC 8414 authorization server metadata.
 func (s *simpleService) handleServerMetadata(w http.ResponseWriter, r *http.Request) {
-	baseURL := s.issuerURL
+	writeMetadata(w, r, s.serverMetadata)
+}
 
-	metadata := map[string]any{
-		"issuer":                                baseURL,
-		"authorization_endpoint":                baseURL + "/auth/authorize",
-		"token_endpoint":                        baseURL + "/auth/token",
-		"device_authorization_endpoint":         baseURL + "/auth/device/code",
-		"response_types_supported":              []string{"code"},
-		"grant_types_supported":                 []string{"authorization_code", "refresh_token", "urn:ietf:params:oauth:grant-type:device_code"},
-		"code_challenge_methods_supported":      []string{"S256"},
-		"token_endpoint_auth_methods_supported": []string{"none"},
-		"scopes_supported":                      []string{"mcp"},
+func writeMetadata(w http.ResponseWriter, r *http.Request, doc *metadataDocument) {
+	w.Header().Set("Cache-Control", "max-age=3600")
+	w.Header().Set("ETag", doc.etag)
+
+	if etagMatches(r.Header.Get("If-None-Match"), doc.etag) {
+		w.WriteHeader(http.StatusNotModified)
+		return
 	}
 
 	w.Header().Set("Content-Type", "application/json")
-	w.Header().Set("Cache-Control", "max-age=3600")
-	_ = json.NewEncoder(w).Encode(metadata)
+	_, _ = w.Write(doc.body)
+}
+
+// etagMatches reports whether an If-None-Match header value matches etag,
+// accepting "*", comma-separated lists and weak validators.
+func etagMatches(ifNoneMatch, etag string) bool {
+	if ifNoneMatch == "" {
+		return false
+	}
+
+	for _, candidate := range strings.Split(ifNoneMatch, ",") {
+		candidate = strings.TrimPrefix(strings.TrimSpace(candidate), "W/")
+		if candidate == "*" || candidate == etag {
+			return true
+		}
+	}
+
+	return false
 }
 
 // handleAuthorize starts the OAuth flow.
@@ -468,7 +852,7 @@ func (s *simpleService) handleAuthorize(w http.ResponseWriter, r *http.Request)
 	resource := q.Get("resource")
 	state := q.Get("state")
 
-	if codeChallengeMethod != "S256" {
+	if codeChallengeMethod != pkceMethodS256 {
 		s.writeError(w, http.StatusBadRequest, "invalid_request", "code_challenge_method must be S256")
 		return
 	}
@@ -478,6 +862,11 @@ func (s *simpleService) handleAuthorize(w http.ResponseWriter, r *http.Request)
 		return
 	}
 
+	if len(codeChallenge) != pkceChallengeLen {
+		s.writeError(w, http.StatusBadRequest, "invalid_request", "code_challenge must be a base64url SHA-256 digest")
+		return
+	}
+
 	if resource == "" {
 		s.writeError(w, http.StatusBadRequest, "invalid_request", "resource is required (RFC 8707)")
 		return
@@ -521,7 +910,7 @@ func (s *simpleService) handleAuthorize(w http.ResponseWriter, r *http.Request)
 	// Redirect to GitHub.
 	baseURL := s.issuerURL
 	callbackURL := baseURL + "/auth/callback"
-	githubURL := s.github.GetAuthorizationURL(callbackURL, githubState, "read:user read:org")
+	githubURL := s.github.GetAuthorizationURL(callbackURL, githubState, githubScope)
 
 	s.log.WithField("client_id", clientID).Info("Starting auth flow")
 	http.Redirect(w, r, githubURL, http.StatusFound)
@@ -578,7 +967,7 @@ func (s *simpleService) handleCallback(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Validate org membership.
-	if len(s.allowedOrgs) > 0 && !githubUser.IsMemberOf(s.allowedOrgs) {
+	if !s.isAllowedMember(githubUser) {
 		s.log.WithFields(logrus.Fields{
 			"login":        githubUser.Login,
 			"user_orgs":    githubUser.Organizations,
@@ -697,7 +1086,7 @@ func (s *simpleService) handleToken(w http.ResponseWriter, r *http.Request) {
 		s.handleAuthorizationCodeGrant(w, r)
 	case "refresh_token":
 		s.handleRefreshTokenGrant(w, r)
-	case "urn:ietf:params:oauth:grant-type:device_code":
+	case deviceCodeGrantType:
 		s.handleDeviceTokenGrant(w, r)
 	default:
 		s.writeError(w, http.StatusBadRequest, "unsupported_grant_type",
@@ -840,7 +1229,7 @@ func (s *simpleService) handleRefreshTokenGrant(w http.ResponseWriter, r *http.R
 	orgs := append([]string(nil), session.Orgs...)
 
 	if len(s.allowedOrgs) > 0 {
-		githubUser, err := s.github.GetUser(r.Context(), session.GitHubAccessToken)
+		githubUser, err := s.refreshGitHubUser(r.Context(), session.GitHubID, session.GitHubAccessToken)
 		if err != nil {
 			s.log.WithError(err).WithField("login", session.GitHubLogin).Warn("Failed to verify GitHub org membership during refresh")
 			s.writeError(w, http.StatusServiceUnavailable, "temporarily_unavailable", "could not verify organization membership")
@@ -855,7 +1244,7 @@ func (s *simpleService) handleRefreshTokenGrant(w http.ResponseWriter, r *http.R
 			return
 		}
 
-		if !githubUser.IsMemberOf(s.allowedOrgs) {
+		if !s.isAllowedMember(githubUser) {
 			s.refreshSessionsMu.Lock()
 			delete(s.refreshSessions, refreshToken)
 			s.refreshSessionsMu.Unlock()
@@ -1036,7 +1425,7 @@ func (s *simpleService) handleDeviceVerify(w http.ResponseWriter, r *http.Reques
 	// Redirect to GitHub for authentication.
 	baseURL := s.issuerURL
 	callbackURL := baseURL + "/auth/callback"
-	githubURL := s.github.GetAuthorizationURL(callbackURL, githubState, "read:user read:org")
+	githubURL := s.github.GetAuthorizationURL(callbackURL, githubState, githubScope)
 
 	s.log.WithFields(logrus.Fields{
 		"user_code":   userCode,
@@ -1280,10 +1669,22 @@ func normalizeUserCode(code string) string {
 	return code
 }
 
+// pkceChallengeLen is the length of an unpadded base64url SHA-256 digest.
+const pkceChallengeLen = 43
+
+// verifyPKCE checks an S256 code verifier against its challenge. The digest
+// is encoded into a stack buffer and compared in constant time.
 func (s *simpleService) verifyPKCE(verifier, challenge string) bool {
+	if len(challenge) != pkceChallengeLen {
+		return false
+	}
+
 	hash := sha256.Sum256([]byte(verifier))
-	computed := base64.RawURLEncoding.EncodeToString(hash[:])
-	return computed == challenge
+
+	var computed [pkceChallengeLen]byte
+	base64.RawURLEncoding.Encode(computed[:], hash[:])
+
+	return subtle.ConstantTimeCompare(computed[:], []byte(challenge)) == 1
 }
 
 func (s *simpleService) writeError(w http.ResponseWriter, status int, errCode, description string) {
@@ -1302,16 +1703,44 @@ func (s *simpleService) writeHTMLError(w http.ResponseWriter, status int, title,
 		html.EscapeString(title), html.EscapeString(title), html.EscapeString(message))
 }
 
-func (s *simpleService) writeUnauthorized(w http.ResponseWriter, baseURL, description string) {
-	w.Header().Set("Content-Type", "application/json")
-	w.Header().Set("WWW-Authenticate", fmt.Sprintf(
-		`Bearer resource_metadata="%s/.well-known/oauth-protected-resource", error="invalid_token", error_description="%s"`,
-		baseURL, description))
-	w.WriteHeader(http.StatusUnauthorized)
-	_ = json.NewEncoder(w).Encode(map[string]string{
+// Error descriptions for 401 responses from the middleware.
+const (
+	descMissingBearer    = "missing or invalid Authorization header"
+	descInvalidToken     = "invalid token"
+	descAudienceMismatch = "token audience mismatch"
+)
+
+// unauthorizedDescriptions are the 401 descriptions rendered at construction.
+var unauthorizedDescriptions = [...]string{descMissingBearer, descInvalidToken, descAudienceMismatch}
+
+// unauthorizedResponse is a rendered 401 challenge header and JSON body.
+type unauthorizedResponse struct {
+	challenge string
+	body      []byte
+}
+
+func (s *simpleService) renderUnauthorized(description string) unauthorizedResponse {
+	body, _ := json.Marshal(map[string]string{
 		"error":             "invalid_token",
 		"error_description": description,
 	})
+
+	return unauthorizedResponse{
+		challenge: s.invalidTokenChallenge + description + `"`,
+		body:      append(body, '\n'),
+	}
+}
+
+func (s *simpleService) writeUnauthorized(w http.ResponseWriter, description string) {
+	resp, ok := s.unauthorizedResponses[description]
+	if !ok {
+		resp = s.renderUnauthorized(description)
+	}
+
+	w.Header().Set("Content-Type", "application/json")
+	w.Header().Set("WWW-Authenticate", resp.challenge)
+	w.WriteHeader(http.StatusUnauthorized)
+	_, _ = w.Write(resp.body)
 }
 
 func (s *simpleService) isExpectedResource(resource string) bool {
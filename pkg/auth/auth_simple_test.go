@@ -5,6 +5,7 @@ import (
 	"crypto/sha256"
 	"encoding/base64"
 	"encoding/json"
+	"fmt"
 	"net/http"
 	"net/http/httptest"
 	"net/url"
@@ -102,6 +103,426 @@ func TestMiddlewareUsesConfiguredIssuerURLInsteadOfRequestHost(t *testing.T) {
 	}
 }
 
+func TestMiddlewareUnauthorizedChallenge(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, nil)
+	handler := svc.Middleware()(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		w.WriteHeader(http.StatusNoContent)
+	}))
+
+	req := httptest.NewRequest(http.MethodGet, "http://internal-proxy/clickhouse/query", nil)
+	rec := httptest.NewRecorder()
+	handler.ServeHTTP(rec, req)
+
+	if rec.Code != http.StatusUnauthorized {
+		t.Fatalf("expected status %d, got %d", http.StatusUnauthorized, rec.Code)
+	}
+
+	want := `Bearer resource_metadata="` + testIssuerURL + `/.well-known/oauth-protected-resource", ` +
+		`error="invalid_token", error_description="missing or invalid Authorization header"`
+	if got := rec.Header().Get("WWW-Authenticate"); got != want {
+		t.Fatalf("unexpected WWW-Authenticate header:\n got: %s\nwant: %s", got, want)
+	}
+
+	var body map[string]string
+	if err := json.Unmarshal(rec.Body.Bytes(), &body); err != nil {
+		t.Fatalf("failed to decode response: %v", err)
+	}
+	if body["error"] != "invalid_token" || body["error_description"] != descMissingBearer {
+		t.Fatalf("unexpected error body: %#v", body)
+	}
+}
+
+func TestValidateAccessToken(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, nil)
+
+	valid, err := svc.issueAccessToken(testIssuerURL, testIssuerURL, "sam", 42, nil)
+	if err != nil {
+		t.Fatalf("issueAccessToken failed: %v", err)
+	}
+
+	otherAudience, err := svc.issueAccessToken(testIssuerURL, "https://other.example.com", "sam", 42, nil)
+	if err != nil {
+		t.Fatalf("issueAccessToken failed: %v", err)
+	}
+
+	otherIssuer, err := svc.issueAccessToken("https://other.example.com", testIssuerURL, "sam", 42, nil)
+	if err != nil {
+		t.Fatalf("issueAccessToken failed: %v", err)
+	}
+
+	claims, reason := svc.validateAccessToken(valid)
+	if claims == nil || claims.GitHubLogin != "sam" {
+		t.Fatalf("expected valid token to pass, got reason %q", reason)
+	}
+
+	for token, want := range map[string]string{
+		otherAudience: descAudienceMismatch,
+		otherIssuer:   descInvalidToken,
+		"not-a-jwt":   descInvalidToken,
+		"a.b.c.d":     descInvalidToken,
+		strings.Repeat("a", maxAccessTokenLen) + ".b.c": descInvalidToken,
+	} {
+		if claims, reason := svc.validateAccessToken(token); claims != nil || reason != want {
+			t.Fatalf("validateAccessToken(%q) = %v, %q; want nil, %q", token, claims, reason, want)
+		}
+	}
+}
+
+func TestMiddlewareCachesValidatedClaims(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, nil)
+	token, err := svc.issueAccessToken(testIssuerURL, testIssuerURL, "sam", 42, []string{"ethpandaops"})
+	if err != nil {
+		t.Fatalf("issueAccessToken failed: %v", err)
+	}
+
+	var logins []string
+	handler := svc.Middleware()(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		logins = append(logins, GetAuthUser(r.Context()).GitHubLogin)
+		w.WriteHeader(http.StatusNoContent)
+	}))
+
+	for range 2 {
+		req := httptest.NewRequest(http.MethodGet, "http://internal-proxy/clickhouse/query", nil)
+		req.Header.Set("Authorization", "Bearer "+token)
+
+		rec := httptest.NewRecorder()
+		handler.ServeHTTP(rec, req)
+
+		if rec.Code != http.StatusNoContent {
+			t.Fatalf("expected status %d, got %d: %s", http.StatusNoContent, rec.Code, rec.Body.String())
+		}
+	}
+
+	if len(logins) != 2 || logins[0] != "sam" || logins[1] != "sam" {
+		t.Fatalf("expected both requests to authenticate as sam, got %v", logins)
+	}
+
+	svc.claimsCacheMu.RLock()
+	_, cached := svc.claimsCache[token]
+	svc.claimsCacheMu.RUnlock()
+	if !cached {
+		t.Fatal("expected validated token claims to be cached")
+	}
+
+	req := httptest.NewRequest(http.MethodGet, "http://internal-proxy/clickhouse/query", nil)
+	req.Header.Set("Authorization", "Bearer "+token+"x")
+
+	rec := httptest.NewRecorder()
+	handler.ServeHTTP(rec, req)
+
+	if rec.Code != http.StatusUnauthorized {
+		t.Fatalf("expected tampered token to be rejected, got %d", rec.Code)
+	}
+}
+
+func TestEvictExpiredClaimsPopsOnlyExpiredTokens(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, nil)
+	now := time.Now()
+
+	for token, offset := range map[string]time.Duration{
+		"expired-1": -2 * time.Minute,
+		"expired-2": -time.Minute,
+		"live":      time.Hour,
+	} {
+		svc.storeClaims(token, &tokenClaims{
+			RegisteredClaims: jwt.RegisteredClaims{ExpiresAt: jwt.NewNumericDate(now.Add(offset))},
+		})
+	}
+
+	svc.claimsCacheMu.Lock()
+	svc.evictExpiredClaims(now)
+	remaining := len(svc.claimsCache)
+	_, live := svc.claimsCache["live"]
+	heapLen := len(svc.claimsExpiry)
+	svc.claimsCacheMu.Unlock()
+
+	if remaining != 1 || !live {
+		t.Fatalf("expected only the live token to remain, got %d entries (live=%v)", remaining, live)
+	}
+	if heapLen != 1 {
+		t.Fatalf("expected expiry heap to track 1 token, got %d", heapLen)
+	}
+}
+
+func TestStoreClaimsEvictsSoonestExpiryWhenFull(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, nil)
+	now := time.Now()
+
+	for i := range maxCachedClaims {
+		svc.storeClaims(fmt.Sprintf("token-%d", i), &tokenClaims{
+			RegisteredClaims: jwt.RegisteredClaims{
+				ExpiresAt: jwt.NewNumericDate(now.Add(time.Hour + time.Duration(i)*time.Second)),
+			},
+		})
+	}
+
+	svc.storeClaims("newest", &tokenClaims{
+		RegisteredClaims: jwt.RegisteredClaims{ExpiresAt: jwt.NewNumericDate(now.Add(2 * time.Hour))},
+	})
+
+	svc.claimsCacheMu.RLock()
+	size := len(svc.claimsCache)
+	_, newest := svc.claimsCache["newest"]
+	_, soonest := svc.claimsCache["token-0"]
+	svc.claimsCacheMu.RUnlock()
+
+	if size != maxCachedClaims {
+		t.Fatalf("expected cache to stay at %d entries, got %d", maxCachedClaims, size)
+	}
+	if !newest {
+		t.Fatal("expected newly validated token to be cached")
+	}
+	if soonest {
+		t.Fatal("expected token closest to expiry to be evicted")
+	}
+}
+
+func TestCleanupRemovesOnlyExpiredRefreshSessions(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, nil)
+
+	var tokens [2]string
+	for i := range tokens {
+		token, err := svc.issueRefreshToken("panda", testIssuerURL, "sam", 42, "github-access-token", nil)
+		if err != nil {
+			t.Fatalf("issueRefreshToken failed: %v", err)
+		}
+		tokens[i] = token
+	}
+
+	svc.refreshSessionsMu.Lock()
+	svc.refreshSessions[tokens[0]].ExpiresAt = time.Now().Add(-time.Minute)
+	svc.refreshSessionsMu.Unlock()
+
+	svc.cleanup()
+
+	svc.refreshSessionsMu.RLock()
+	_, expired := svc.refreshSessions[tokens[0]]
+	_, live := svc.refreshSessions[tokens[1]]
+	svc.refreshSessionsMu.RUnlock()
+
+	if expired {
+		t.Fatal("expected expired refresh session to be removed")
+	}
+	if !live {
+		t.Fatal("expected live refresh session to be kept")
+	}
+}
+
+func TestBearerToken(t *testing.T) {
+	t.Parallel()
+
+	for header, want := range map[string]string{
+		"Bearer abc": "abc",
+		"bearer abc": "abc",
+		"BEARER abc": "abc",
+		"Bearer ":    "",
+		"Basic abc":  "",
+		"":           "",
+	} {
+		got, ok := bearerToken(header)
+		if got != want || ok != (want != "") {
+			t.Fatalf("bearerToken(%q) = %q, %v; want %q", header, got, ok, want)
+		}
+	}
+}
+
+func TestIsPublicPath(t *testing.T) {
+	t.Parallel()
+
+	for path, want := range map[string]bool{
+		"/":                                     true,
+		"/health":                               true,
+		"/ready":                                true,
+		"/auth/token":                           true,
+		"/.well-known/oauth-protected-resource": true,
+		"/.well-known/oauth-authorization-server": true,
+		"/mcp":              false,
+		"/clickhouse/query": false,
+		"/healthz":          false,
+		"/auth":             false,
+	} {
+		if got := isPublicPath(path); got != want {
+			t.Fatalf("isPublicPath(%q) = %v, want %v", path, got, want)
+		}
+	}
+}
+
+func TestVerifyPKCE(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, nil)
+
+	// RFC 7636 Appendix B.
+	verifier := "dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk"
+	challenge := "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM"
+
+	if !svc.verifyPKCE(verifier, challenge) {
+		t.Fatal("expected RFC 7636 test vector to verify")
+	}
+	if svc.verifyPKCE(verifier+"x", challenge) {
+		t.Fatal("expected mismatched verifier to fail")
+	}
+	if svc.verifyPKCE(verifier, challenge+"=") {
+		t.Fatal("expected padded challenge to fail")
+	}
+}
+
+func TestIsAllowedMember(t *testing.T) {
+	t.Parallel()
+
+	restricted := newTestSimpleService(t, []string{"ethpandaops", "ethereum"})
+	open := newTestSimpleService(t, nil)
+
+	member := &github.GitHubUser{Organizations: []string{"other", "ethereum"}}
+	outsider := &github.GitHubUser{Organizations: []string{"other"}}
+
+	if !restricted.isAllowedMember(member) {
+		t.Fatalf("expected member of an allowed org to pass")
+	}
+
+	if restricted.isAllowedMember(outsider) {
+		t.Fatalf("expected user outside allowed orgs to be rejected")
+	}
+
+	if !open.isAllowedMember(outsider) {
+		t.Fatalf("expected any user to pass without allowed orgs")
+	}
+}
+
+func TestRefreshGitHubUserCachesLookupPerToken(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, []string{"ethpandaops"})
+	stubGitHub := &stubGitHubClient{
+		user: &github.GitHubUser{ID: 42, Login: "sam", Organizations: []string{"ethpandaops"}},
+	}
+	svc.github = stubGitHub
+
+	for range 2 {
+		user, err := svc.refreshGitHubUser(context.Background(), 42, "github-access-token")
+		if err != nil {
+			t.Fatalf("refreshGitHubUser failed: %v", err)
+		}
+		if user.Login != "sam" {
+			t.Fatalf("expected login sam, got %q", user.Login)
+		}
+	}
+
+	if stubGitHub.getUserCalls != 1 {
+		t.Fatalf("expected 1 GitHub lookup for a repeated token, got %d", stubGitHub.getUserCalls)
+	}
+
+	// Another session of the same user holds its own token, which must be
+	// checked against GitHub rather than ride on the first session's lookup.
+	if _, err := svc.refreshGitHubUser(context.Background(), 42, "other-access-token"); err != nil {
+		t.Fatalf("refreshGitHubUser failed: %v", err)
+	}
+
+	if stubGitHub.getUserCalls != 2 {
+		t.Fatalf("expected a new GitHub lookup for a different token, got %d calls", stubGitHub.getUserCalls)
+	}
+
+	// A token resolving to a different user must not be cached under the
+	// session's user ID.
+	for range 2 {
+		if _, err := svc.refreshGitHubUser(context.Background(), 7, "stolen-access-token"); err != nil {
+			t.Fatalf("refreshGitHubUser failed: %v", err)
+		}
+	}
+
+	if stubGitHub.getUserCalls != 4 {
+		t.Fatalf("expected mismatched lookups to bypass the cache, got %d calls", stubGitHub.getUserCalls)
+	}
+}
+
+func TestRefreshGitHubUserEvictsRejectedToken(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, []string{"ethpandaops"})
+	stubGitHub := &stubGitHubClient{
+		user: &github.GitHubUser{ID: 42, Login: "sam", Organizations: []string{"ethpandaops"}},
+	}
+	svc.github = stubGitHub
+
+	if _, err := svc.refreshGitHubUser(context.Background(), 42, "github-access-token"); err != nil {
+		t.Fatalf("refreshGitHubUser failed: %v", err)
+	}
+
+	key := githubUserKey{githubID: 42, tokenHash: sha256.Sum256([]byte("github-access-token"))}
+
+	svc.githubUsersMu.Lock()
+	svc.githubUsers[key].expiresAt = time.Now().Add(-time.Second)
+	svc.githubUsersMu.Unlock()
+
+	stubGitHub.err = fmt.Errorf("%w: status 401", github.ErrGitHubAPI)
+	if _, err := svc.refreshGitHubUser(context.Background(), 42, "github-access-token"); err == nil {
+		t.Fatal("expected a revoked token to fail the lookup")
+	}
+
+	svc.githubUsersMu.Lock()
+	_, cached := svc.githubUsers[key]
+	svc.githubUsersMu.Unlock()
+	if cached {
+		t.Fatal("expected the rejected token's lookup to be evicted")
+	}
+}
+
+func TestDiscoveryMetadataUsesConfiguredIssuerURL(t *testing.T) {
+	t.Parallel()
+
+	svc := newTestSimpleService(t, nil)
+
+	for _, tc := range []struct {
+		handler http.HandlerFunc
+		key     string
+	}{
+		{handler: svc.handleResourceMetadata, key: "resource"},
+		{handler: svc.handleServerMetadata, key: "issuer"},
+	} {
+		rec := httptest.NewRecorder()
+		tc.handler(rec, httptest.NewRequest(http.MethodGet, "http://internal-proxy/.well-known/x", nil))
+
+		if ct := rec.Header().Get("Content-Type"); ct != "application/json" {
+			t.Fatalf("expected JSON content type, got %q", ct)
+		}
+
+		var body map[string]any
+		if err := json.Unmarshal(rec.Body.Bytes(), &body); err != nil {
+			t.Fatalf("failed to decode metadata: %v", err)
+		}
+
+		if body[tc.key] != testIssuerURL {
+			t.Fatalf("expected %s %q, got %#v", tc.key, testIssuerURL, body[tc.key])
+		}
+
+		etag := rec.Header().Get("ETag")
+		if etag == "" {
+			t.Fatal("expected ETag header on metadata response")
+		}
+
+		req := httptest.NewRequest(http.MethodGet, "http://internal-proxy/.well-known/x", nil)
+		req.Header.Set("If-None-Match", etag)
+		rec = httptest.NewRecorder()
+		tc.handler(rec, req)
+
+		if rec.Code != http.StatusNotModified || rec.Body.Len() != 0 {
+			t.Fatalf("expected empty %d for matching ETag, got %d", http.StatusNotModified, rec.Code)
+		}
+	}
+}
+
 func TestHandleTokenRefreshGrantRevalidatesOrgMembership(t *testing.T) {
 	t.Parallel()
 
@@ -250,6 +671,7 @@ type tokenResponseBody struct {
 
 type stubGitHubClient struct {
 	user         *github.GitHubUser
+	err          error
 	getUserCalls int
 }
 
@@ -263,6 +685,10 @@ func (s *stubGitHubClient) ExchangeCode(_ context.Context, code, redirectURI str
 
 func (s *stubGitHubClient) GetUser(_ context.Context, accessToken string) (*github.GitHubUser, error) {
 	s.getUserCalls++
+	if s.err != nil {
+		return nil, s.err
+	}
+
 	return s.user, nil
 }
 
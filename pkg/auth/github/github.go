@@ -34,6 +34,17 @@ const (
 
 	// Default HTTP timeout.
 	defaultTimeout = 30 * time.Second
+
+	// Idle connection pool for GitHub. Requests go to only two hosts
+	// (github.com and api.github.com), and each login issues concurrent
+	// profile and org lookups, so more than net/http's default of 2 idle
+	// connections per host are kept.
+	githubMaxIdleConnsPerHost = 16
+	githubIdleConnTimeout     = 90 * time.Second
+
+	// Page size and page cap for /user/orgs. GitHub defaults to 30 per page.
+	orgsPerPage = 100
+	maxOrgPages = 10
 )
 
 // Client provides GitHub OAuth operations.
@@ -51,12 +62,22 @@ func NewClient(log logrus.FieldLogger, clientID, clientSecret string) *Client {
 		clientID:     clientID,
 		clientSecret: clientSecret,
 		httpClient: &http.Client{
-			Transport: &version.Transport{},
+			Transport: &version.Transport{Base: newTransport()},
 			Timeout:   defaultTimeout,
 		},
 	}
 }
 
+// newTransport returns a keep-alive transport dedicated to GitHub. Cloning
+// the default transport keeps its proxy settings and HTTP/2 negotiation.
+func newTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = githubMaxIdleConnsPerHost
+	transport.IdleConnTimeout = githubIdleConnTimeout
+
+	return transport
+}
+
 // GetAuthorizationURL generates the GitHub OAuth authorization URL.
 func (c *Client) GetAuthorizationURL(redirectURI, state, scope string) string {
 	if scope == "" {
@@ -137,7 +158,24 @@ func (c *Client) ExchangeCode(ctx context.Context, code, redirectURI string) (*T
 }
 
 // GetUser fetches the user profile and organization memberships.
+// The profile and organization requests are independent, so they run
+// concurrently.
 func (c *Client) GetUser(ctx context.Context, accessToken string) (*GitHubUser, error) {
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	type orgsResult struct {
+		orgs []string
+		err  error
+	}
+
+	orgsCh := make(chan orgsResult, 1)
+
+	go func() {
+		orgs, err := c.getUserOrganizations(ctx, accessToken)
+		orgsCh <- orgsResult{orgs: orgs, err: err}
+	}()
+
 	// Get user profile.
 	userResp, err := c.getUserProfile(ctx, accessToken)
 	if err != nil {
@@ -145,11 +183,13 @@ func (c *Client) GetUser(ctx context.Context, accessToken string) (*GitHubUser,
 	}
 
 	// Get user organizations.
-	orgs, err := c.getUserOrganizations(ctx, accessToken)
-	if err != nil {
-		return nil, fmt.Errorf("fetching user organizations: %w", err)
+	orgsRes := <-orgsCh
+	if orgsRes.err != nil {
+		return nil, fmt.Errorf("fetching user organizations: %w", orgsRes.err)
 	}
 
+	orgs := orgsRes.orgs
+
 	user := &GitHubUser{
 		ID:            userResp.ID,
 		Login:         userResp.Login,
@@ -184,14 +224,11 @@ func (c *Client) getUserProfile(ctx context.Context, accessToken string) (*githu
 		return nil, fmt.Errorf("%w: fetching user: %w", ErrGitHubAPI, err)
 	}
 
-	defer func() { _ = resp.Body.Close() }()
-
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("%w: reading response: %w", ErrGitHubAPI, err)
-	}
+	defer closeBody(resp)
 
 	if resp.StatusCode != http.StatusOK {
+		body, _ := io.ReadAll(resp.Body)
+
 		c.log.WithFields(logrus.Fields{
 			"status_code": resp.StatusCode,
 			"response":    string(body),
@@ -201,18 +238,51 @@ func (c *Client) getUserProfile(ctx context.Context, accessToken string) (*githu
 	}
 
 	var userResp githubUserResponse
-	if err := json.Unmarshal(body, &userResp); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&userResp); err != nil {
 		return nil, fmt.Errorf("%w: parsing response: %w", ErrGitHubAPI, err)
 	}
 
 	return &userResp, nil
 }
 
-// getUserOrganizations fetches the user's organization memberships.
+// getUserOrganizations fetches the user's organization memberships,
+// following pagination up to maxOrgPages pages. Hitting the cap with pages
+// left is logged as a warning.
 func (c *Client) getUserOrganizations(ctx context.Context, accessToken string) ([]string, error) {
-	req, err := http.NewRequestWithContext(ctx, http.MethodGet, fmt.Sprintf("%s/user/orgs", githubAPIURL), nil)
+	var orgs []string
+
+	pageURL := fmt.Sprintf("%s/user/orgs?per_page=%d", githubAPIURL, orgsPerPage)
+	for page := 0; pageURL != "" && page < maxOrgPages; page++ {
+		pageOrgs, next, err := c.getUserOrganizationsPage(ctx, accessToken, pageURL)
+		if err != nil {
+			return nil, err
+		}
+
+		orgs = append(orgs, pageOrgs...)
+		pageURL = next
+	}
+
+	if pageURL != "" {
+		// Allowed-org checks run on this truncated list, so a denial for a
+		// user in more orgs than the cap covers must be explainable.
+		c.log.WithFields(logrus.Fields{
+			"fetched_orgs": len(orgs),
+			"max_pages":    maxOrgPages,
+		}).Warn("User organizations truncated at page cap")
+	}
+
+	return orgs, nil
+}
+
+// getUserOrganizationsPage fetches one page of /user/orgs and returns the
+// URL of the next page, if any, from the Link header.
+func (c *Client) getUserOrganizationsPage(
+	ctx context.Context,
+	accessToken, pageURL string,
+) ([]string, string, error) {
+	req, err := http.NewRequestWithContext(ctx, http.MethodGet, pageURL, nil)
 	if err != nil {
-		return nil, fmt.Errorf("%w: creating request: %w", ErrGitHubAPI, err)
+		return nil, "", fmt.Errorf("%w: creating request: %w", ErrGitHubAPI, err)
 	}
 
 	req.Header.Set("Authorization", fmt.Sprintf("Bearer %s", accessToken))
@@ -221,27 +291,22 @@ func (c *Client) getUserOrganizations(ctx context.Context, accessToken string) (
 
 	resp, err := c.httpClient.Do(req)
 	if err != nil {
-		return nil, fmt.Errorf("%w: fetching orgs: %w", ErrGitHubAPI, err)
+		return nil, "", fmt.Errorf("%w: fetching orgs: %w", ErrGitHubAPI, err)
 	}
 
-	defer func() { _ = resp.Body.Close() }()
-
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("%w: reading response: %w", ErrGitHubAPI, err)
-	}
+	defer closeBody(resp)
 
 	if resp.StatusCode != http.StatusOK {
 		c.log.WithFields(logrus.Fields{
 			"status_code": resp.StatusCode,
 		}).Warn("Failed to fetch user organizations")
 
-		return nil, fmt.Errorf("%w: status %d", ErrGitHubAPI, resp.StatusCode)
+		return nil, "", fmt.Errorf("%w: status %d", ErrGitHubAPI, resp.StatusCode)
 	}
 
 	var orgsResp []githubOrgResponse
-	if err := json.Unmarshal(body, &orgsResp); err != nil {
-		return nil, fmt.Errorf("%w: parsing response: %w", ErrGitHubAPI, err)
+	if err := json.NewDecoder(resp.Body).Decode(&orgsResp); err != nil {
+		return nil, "", fmt.Errorf("%w: parsing response: %w", ErrGitHubAPI, err)
 	}
 
 	orgs := make([]string, 0, len(orgsResp))
@@ -249,7 +314,31 @@ func (c *Client) getUserOrganizations(ctx context.Context, accessToken string) (
 		orgs = append(orgs, org.Login)
 	}
 
-	return orgs, nil
+	return orgs, nextPageURL(resp.Header.Get("Link")), nil
+}
+
+// closeBody drains and closes a response body so the connection can be
+// reused after a streaming decode.
+func closeBody(resp *http.Response) {
+	_, _ = io.Copy(io.Discard, resp.Body)
+	_ = resp.Body.Close()
+}
+
+// nextPageURL extracts the rel="next" target from a GitHub Link header.
+func nextPageURL(link string) string {
+	for _, part := range strings.Split(link, ",") {
+		target, params, ok := strings.Cut(strings.TrimSpace(part), ";")
+		if !ok || !strings.Contains(params, `rel="next"`) {
+			continue
+		}
+
+		target = strings.TrimSpace(target)
+		if strings.HasPrefix(target, "<") && strings.HasSuffix(target, ">") {
+			return target[1 : len(target)-1]
+		}
+	}
+
+	return ""
 }
 
 // ValidateRedirectURI validates a redirect URI for security.
@@ -262,17 +351,15 @@ func ValidateRedirectURI(uri string) bool {
 		return false
 	}
 
-	// Check for localhost (allowed with HTTP).
-	host := parsed.Hostname()
-	if host == "localhost" || host == "127.0.0.1" || host == "::1" {
+	switch parsed.Hostname() {
+	case "localhost", "127.0.0.1", "::1":
+		// Localhost is allowed with HTTP.
 		return parsed.Scheme == "http" || parsed.Scheme == "https"
-	}
-
-	// Non-localhost must be HTTPS.
-	if parsed.Scheme != "https" {
+	case "":
+		// Must have a valid host.
 		return false
+	default:
+		// Non-localhost must be HTTPS.
+		return parsed.Scheme == "https"
 	}
-
-	// Must have a valid host.
-	return host != ""
 }
@@ -29,11 +29,24 @@ func (u *GitHubUser) IsMemberOf(allowedOrgs []string) bool {
 		return true
 	}
 
-	for _, userOrg := range u.Organizations {
-		for _, allowedOrg := range allowedOrgs {
-			if userOrg == allowedOrg {
-				return true
-			}
+	allowed := make(map[string]struct{}, len(allowedOrgs))
+	for _, org := range allowedOrgs {
+		allowed[org] = struct{}{}
+	}
+
+	return u.IsMemberOfAny(allowed)
+}
+
+// IsMemberOfAny is IsMemberOf for callers that keep the allowed organizations
+// as a prebuilt set. If allowed is empty, returns true (no restriction).
+func (u *GitHubUser) IsMemberOfAny(allowed map[string]struct{}) bool {
+	if len(allowed) == 0 {
+		return true
+	}
+
+	for _, org := range u.Organizations {
+		if _, ok := allowed[org]; ok {
+			return true
 		}
 	}
 
@@ -4,7 +4,10 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
 	"net/http"
+	"os"
+	"path/filepath"
 	"regexp"
 	"sort"
 	"strings"
@@ -24,6 +27,9 @@ const (
 
 	// DefaultHTTPTimeout is the default HTTP request timeout.
 	DefaultHTTPTimeout = 30 * time.Second
+
+	// DefaultCacheFileName is the default file name for the on-disk network cache.
+	DefaultCacheFileName = "cartographoor-networks.json"
 )
 
 // groupPattern extracts group name from repository (e.g., "ethpandaops/fusaka-devnets" -> "fusaka").
@@ -34,6 +40,15 @@ type CartographoorConfig struct {
 	URL      string
 	CacheTTL time.Duration
 	Timeout  time.Duration
+	// CachePath is an optional file used to persist the last fetched
+	// networks.json and its ETag across restarts. Empty disables it.
+	CachePath string
+}
+
+// diskCache is the on-disk representation of the last successful fetch.
+type diskCache struct {
+	ETag string          `json:"etag"`
+	Body json.RawMessage `json:"body"`
 }
 
 // CartographoorClient fetches and caches network data from cartographoor.
@@ -68,6 +83,9 @@ type cartographoorClient struct {
 	groups      map[string][]string // group name -> network names
 	lastUpdated time.Time
 
+	// etag is only touched by refresh, which never runs concurrently.
+	etag string
+
 	done chan struct{}
 	wg   sync.WaitGroup
 }
@@ -102,9 +120,17 @@ func NewCartographoorClient(log logrus.FieldLogger, cfg CartographoorConfig) Car
 func (c *cartographoorClient) Start(ctx context.Context) error {
 	c.log.WithField("url", c.cfg.URL).Info("Starting cartographoor client")
 
-	// Initial fetch
+	c.loadDiskCache()
+
+	// Initial fetch. A previously persisted copy lets us start when
+	// cartographoor is unreachable, and turns the fetch into a cheap
+	// conditional request when nothing has changed.
 	if err := c.refresh(ctx); err != nil {
-		return fmt.Errorf("initial fetch failed: %w", err)
+		if len(c.networks) == 0 {
+			return fmt.Errorf("initial fetch failed: %w", err)
+		}
+
+		c.log.WithError(err).Warn("Initial fetch failed, using cached network data")
 	}
 
 	// Start background refresh
@@ -253,18 +279,47 @@ func (c *cartographoorClient) refresh(ctx context.Context) error {
 		return fmt.Errorf("creating request: %w", err)
 	}
 
+	if c.etag != "" {
+		req.Header.Set("If-None-Match", c.etag)
+	}
+
 	resp, err := c.client.Do(req)
 	if err != nil {
 		return fmt.Errorf("fetching data: %w", err)
 	}
 	defer func() { _ = resp.Body.Close() }()
 
+	if resp.StatusCode == http.StatusNotModified {
+		c.mu.Lock()
+		c.lastUpdated = time.Now()
+		c.mu.Unlock()
+
+		return nil
+	}
+
 	if resp.StatusCode != http.StatusOK {
 		return fmt.Errorf("unexpected status code: %d", resp.StatusCode)
 	}
 
+	body, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return fmt.Errorf("reading response: %w", err)
+	}
+
+	if err := c.apply(body); err != nil {
+		return err
+	}
+
+	c.etag = resp.Header.Get("ETag")
+	c.saveDiskCache(body)
+
+	return nil
+}
+
+// apply decodes a networks.json payload and swaps it into the cache.
+func (c *cartographoorClient) apply(body []byte) error {
 	var result discovery.Result
-	if err := json.NewDecoder(resp.Body).Decode(&result); err != nil {
+	if err := json.Unmarshal(body, &result); err != nil {
 		return fmt.Errorf("decoding response: %w", err)
 	}
 
@@ -292,3 +347,66 @@ func (c *cartographoorClient) refresh(ctx context.Context) error {
 
 	return nil
 }
+
+// loadDiskCache seeds the in-memory cache and ETag from CachePath, if set.
+func (c *cartographoorClient) loadDiskCache() {
+	if c.cfg.CachePath == "" {
+		return
+	}
+
+	data, err := os.ReadFile(c.cfg.CachePath)
+	if err != nil {
+		if !os.IsNotExist(err) {
+			c.log.WithError(err).Debug("Failed to read network cache")
+		}
+
+		return
+	}
+
+	var cache diskCache
+	if err := json.Unmarshal(data, &cache); err != nil {
+		c.log.WithError(err).Debug("Failed to decode network cache")
+
+		return
+	}
+
+	if err := c.apply(cache.Body); err != nil {
+		c.log.WithError(err).Debug("Failed to apply network cache")
+
+		return
+	}
+
+	c.etag = cache.ETag
+}
+
+// saveDiskCache persists the latest payload and ETag to CachePath, if set.
+// The file is written atomically so a crash never leaves a partial cache.
+func (c *cartographoorClient) saveDiskCache(body []byte) {
+	if c.cfg.CachePath == "" {
+		return
+	}
+
+	data, err := json.Marshal(diskCache{ETag: c.etag, Body: body})
+	if err != nil {
+		c.log.WithError(err).Debug("Failed to encode network cache")
+
+		return
+	}
+
+	if err := os.MkdirAll(filepath.Dir(c.cfg.CachePath), 0o700); err != nil {
+		c.log.WithError(err).Debug("Failed to create network cache directory")
+
+		return
+	}
+
+	tmp := c.cfg.CachePath + ".tmp"
+	if err := os.WriteFile(tmp, data, 0o600); err != nil {
+		c.log.WithError(err).Debug("Failed to write network cache")
+
+		return
+	}
+
+	if err := os.Rename(tmp, c.cfg.CachePath); err != nil {
+		c.log.WithError(err).Debug("Failed to write network cache")
+	}
+}
@@ -30,6 +30,13 @@ type ProxyAware interface {
 	SetProxyClient(client proxy.Service)
 }
 
+// LoggerAware is an optional interface for modules that log before their
+// resources are registered (e.g. during Start), so they use the application's
+// configured logger rather than the unconfigured global one.
+type LoggerAware interface {
+	SetLogger(log logrus.FieldLogger)
+}
+
 // ProxyDiscoverable modules initialize from datasources discovered via the proxy.
 type ProxyDiscoverable interface {
 	// InitFromDiscovery initializes the module from discovered datasources.
@@ -7,6 +7,7 @@ import (
 	"net/http"
 	"net/http/httputil"
 	"net/url"
+	"sort"
 	"strings"
 	"time"
 
@@ -34,6 +35,9 @@ type ClickHouseConfig struct {
 type ClickHouseHandler struct {
 	log      logrus.FieldLogger
 	clusters map[string]*clickhouseCluster
+	// available lists the cluster names for unknown-cluster errors. The
+	// cluster set is fixed at construction, so it is rendered once.
+	available string
 }
 
 type clickhouseCluster struct {
@@ -48,10 +52,16 @@ func NewClickHouseHandler(log logrus.FieldLogger, configs []ClickHouseConfig) *C
 		clusters: make(map[string]*clickhouseCluster, len(configs)),
 	}
 
+	names := make([]string, 0, len(configs))
+
 	for _, cfg := range configs {
 		h.clusters[cfg.Name] = h.createCluster(cfg)
+		names = append(names, cfg.Name)
 	}
 
+	sort.Strings(names)
+	h.available = strings.Join(names, ", ")
+
 	return h
 }
 
@@ -126,7 +136,7 @@ func (h *ClickHouseHandler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 
 	cluster, ok := h.clusters[clusterName]
 	if !ok {
-		http.Error(w, fmt.Sprintf("unknown cluster: %s", clusterName), http.StatusNotFound)
+		http.Error(w, fmt.Sprintf("unknown cluster: %s (available: %s)", clusterName, h.available), http.StatusNotFound)
 
 		return
 	}
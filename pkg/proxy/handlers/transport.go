@@ -7,18 +7,25 @@ import (
 	"time"
 )
 
-// Transport defaults for all reverse proxy handlers.
+// Transport defaults for all reverse proxy handlers. Each datasource has a
+// single upstream host, so the per-host idle pool matches the server's
+// upstream pool; otherwise concurrent sandbox batches would close and redial
+// connections above the idle limit on every burst.
 const (
 	defaultDialTimeout         = 10 * time.Second
 	defaultTLSHandshakeTimeout = 10 * time.Second
 	defaultMaxIdleConns        = 100
-	defaultMaxIdleConnsPerHost = 10
+	defaultMaxIdleConnsPerHost = 32
 	defaultIdleConnTimeout     = 90 * time.Second
 )
 
 // newProxyTransport returns an *http.Transport with sensible defaults for
 // reverse-proxying upstream datasources. Setting skipVerify disables TLS
 // certificate verification on the upstream connection.
+//
+// A custom TLSClientConfig/DialContext disables net/http's automatic HTTP/2,
+// so it is re-enabled explicitly: HTTPS upstreams that support it multiplex
+// concurrent queries over one connection, others fall back to HTTP/1.1 via ALPN.
 func newProxyTransport(skipVerify bool) *http.Transport {
 	return &http.Transport{
 		TLSClientConfig: &tls.Config{
@@ -29,5 +36,6 @@ func newProxyTransport(skipVerify bool) *http.Transport {
 		MaxIdleConns:        defaultMaxIdleConns,
 		MaxIdleConnsPerHost: defaultMaxIdleConnsPerHost,
 		IdleConnTimeout:     defaultIdleConnTimeout,
+		ForceAttemptHTTP2:   true,
 	}
 }
@@ -206,7 +206,7 @@ func (s *service) handleCBTLinkModel(w http.ResponseWriter, r *http.Request) {
 
 	writeOperationResponse(s.log, w, http.StatusOK, operations.Response{
 		Kind: operations.ResultKindObject,
-		Data: map[string]any{"url": strings.TrimRight(baseURL, "/") + linkPath},
+		Data: map[string]any{"url": baseURL + linkPath},
 		Meta: map[string]any{"network": optionalStringArg(req.Args, "network")},
 	})
 }
@@ -218,7 +218,7 @@ func (s *service) cbtNetworks() (map[string]string, error) {
 
 	networks := make(map[string]string)
 	for name := range s.cartographoorClient.GetActiveNetworks() {
-		networks[name] = fmt.Sprintf("https://cbt.%s.ethpandaops.io", name)
+		networks[name] = cbtURL(name)
 	}
 
 	return networks, nil
@@ -230,24 +230,34 @@ func (s *service) cbtBaseURL(args map[string]any) (string, int, error) {
 		return "", http.StatusBadRequest, err
 	}
 
+	if s.cartographoorClient == nil {
+		return "", http.StatusServiceUnavailable, fmt.Errorf("cbt is unavailable")
+	}
+
+	// Resolve the single requested network; the full map is only needed to
+	// list alternatives in the error.
+	if info, ok := s.cartographoorClient.GetNetwork(network); ok && info.Status == "active" {
+		return cbtURL(network), http.StatusOK, nil
+	}
+
 	networks, err := s.cbtNetworks()
 	if err != nil {
 		return "", http.StatusServiceUnavailable, err
 	}
 
-	baseURL, ok := networks[network]
-	if !ok {
-		names := make([]string, 0, len(networks))
-		for name := range networks {
-			names = append(names, name)
-		}
+	names := make([]string, 0, len(networks))
+	for name := range networks {
+		names = append(names, name)
+	}
 
-		sort.Strings(names)
+	sort.Strings(names)
 
-		return "", http.StatusNotFound, fmt.Errorf("unknown network %q. Available: %v", network, names)
-	}
+	return "", http.StatusNotFound, fmt.Errorf("unknown network %q. Available: %v", network, names)
+}
 
-	return baseURL, http.StatusOK, nil
+// cbtURL returns the CBT base URL for a network, without a trailing slash.
+func cbtURL(network string) string {
+	return fmt.Sprintf("https://cbt.%s.ethpandaops.io", network)
 }
 
 func (s *service) cbtAPIGetRaw(
@@ -255,7 +265,7 @@ func (s *service) cbtAPIGetRaw(
 	baseURL, path string,
 	params url.Values,
 ) ([]byte, string, int, error) {
-	requestURL := strings.TrimRight(baseURL, "/") + path
+	requestURL := baseURL + path
 	if len(params) > 0 {
 		requestURL += "?" + params.Encode()
 	}
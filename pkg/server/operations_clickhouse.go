@@ -9,12 +9,22 @@ import (
 	"github.com/ethpandaops/panda/pkg/operations"
 )
 
+// ClickHouse output formats requested by the query operations. TSV keeps the
+// sandbox's text decoders simple; ArrowStream carries typed columns that load
+// into pyarrow without per-cell parsing.
+const (
+	clickhouseFormatTSV   = "TabSeparatedWithNames"
+	clickhouseFormatArrow = "ArrowStream"
+)
+
 func (s *service) handleClickHouseOperation(operationID string, w http.ResponseWriter, r *http.Request) bool {
 	switch operationID {
 	case "clickhouse.list_datasources":
 		s.handleClickHouseListDatasources(w)
 	case "clickhouse.query", "clickhouse.query_raw":
-		s.handleClickHouseQuery(w, r)
+		s.handleClickHouseQuery(w, r, clickhouseFormatTSV)
+	case "clickhouse.query_arrow":
+		s.handleClickHouseQuery(w, r, clickhouseFormatArrow)
 	default:
 		return false
 	}
@@ -38,7 +48,7 @@ func (s *service) handleClickHouseListDatasources(w http.ResponseWriter) {
 	})
 }
 
-func (s *service) handleClickHouseQuery(w http.ResponseWriter, r *http.Request) {
+func (s *service) handleClickHouseQuery(w http.ResponseWriter, r *http.Request, format string) {
 	req, err := decodeOperationRequest(r)
 	if err != nil {
 		http.Error(w, err.Error(), http.StatusBadRequest)
@@ -57,7 +67,18 @@ func (s *service) handleClickHouseQuery(w http.ResponseWriter, r *http.Request)
 		return
 	}
 
-	params := url.Values{"default_format": {"TabSeparatedWithNames"}}
+	// ClickHouse only compresses HTTP responses when asked to. The gzip
+	// Accept-Encoding added by Go's transport is forwarded by the proxy and
+	// the body is decompressed transparently on receipt.
+	params := url.Values{
+		"default_format":          {format},
+		"enable_http_compression": {"1"},
+	}
+	if format == clickhouseFormatArrow {
+		// zstd buffers decode natively in pyarrow and compress columnar data
+		// better than the lz4_frame default.
+		params.Set("output_format_arrow_compression_method", "zstd")
+	}
 	for key, value := range optionalMapArg(req.Args, "parameters") {
 		params.Set("param_"+key, formatClickHouseParamValue(value))
 	}
@@ -15,6 +15,15 @@ import (
 	"github.com/ethpandaops/panda/pkg/operations"
 )
 
+// doraValidatorInfoFields maps Dora epoch validatorinfo keys onto the
+// network overview fields returned to the sandbox.
+var doraValidatorInfoFields = [...]struct{ dst, src string }{
+	{dst: "active_validator_count", src: "active"},
+	{dst: "total_validator_count", src: "total"},
+	{dst: "pending_validator_count", src: "pending"},
+	{dst: "exited_validator_count", src: "exited"},
+}
+
 func (s *service) handleDoraOperation(operationID string, w http.ResponseWriter, r *http.Request) bool {
 	switch operationID {
 	case "dora.list_networks":
@@ -115,17 +124,16 @@ func (s *service) handleDoraNetworkOverview(w http.ResponseWriter, r *http.Reque
 	}
 
 	payload, _ := data["data"].(map[string]any)
-	overview := map[string]any{
-		"current_epoch":      payload["epoch"],
-		"current_slot":       multiplyEpoch(payload["epoch"]),
-		"finalized":          payload["finalized"],
-		"participation_rate": payload["globalparticipationrate"],
-	}
+	overview := make(map[string]any, 4+len(doraValidatorInfoFields))
+	overview["current_epoch"] = payload["epoch"]
+	overview["current_slot"] = multiplyEpoch(payload["epoch"])
+	overview["finalized"] = payload["finalized"]
+	overview["participation_rate"] = payload["globalparticipationrate"]
+
 	if validatorInfo, ok := payload["validatorinfo"].(map[string]any); ok {
-		overview["active_validator_count"] = validatorInfo["active"]
-		overview["total_validator_count"] = validatorInfo["total"]
-		overview["pending_validator_count"] = validatorInfo["pending"]
-		overview["exited_validator_count"] = validatorInfo["exited"]
+		for _, field := range doraValidatorInfoFields {
+			overview[field.dst] = validatorInfo[field.src]
+		}
 	}
 
 	writeOperationResponse(s.log, w, http.StatusOK, operations.Response{
@@ -149,6 +157,9 @@ func (s *service) handleDoraValidators(w http.ResponseWriter, r *http.Request) {
 	}
 
 	params := url.Values{"limit": {fmt.Sprintf("%d", optionalIntArg(req.Args, "limit", 100))}}
+	if offset := optionalIntArg(req.Args, "offset", 0); offset > 0 {
+		params.Set("offset", strconv.Itoa(offset))
+	}
 	if statusFilter := optionalStringArg(req.Args, "status"); statusFilter != "" {
 		params.Set("status", statusFilter)
 	}
@@ -221,7 +232,7 @@ func (s *service) handleDoraLink(w http.ResponseWriter, r *http.Request, pathTem
 
 	writeOperationResponse(s.log, w, http.StatusOK, operations.Response{
 		Kind: operations.ResultKindObject,
-		Data: map[string]any{"url": strings.TrimRight(baseURL, "/") + fmt.Sprintf(pathTemplate, identifier)},
+		Data: map[string]any{"url": baseURL + fmt.Sprintf(pathTemplate, identifier)},
 		Meta: map[string]any{"network": optionalStringArg(req.Args, "network")},
 	})
 }
@@ -234,7 +245,7 @@ func (s *service) doraNetworks() (map[string]string, error) {
 	networks := make(map[string]string)
 	for name, network := range s.cartographoorClient.GetActiveNetworks() {
 		if network.ServiceURLs != nil && network.ServiceURLs.Dora != "" {
-			networks[name] = network.ServiceURLs.Dora
+			networks[name] = normalizeBaseURL(network.ServiceURLs.Dora)
 		}
 	}
 
@@ -247,22 +258,34 @@ func (s *service) doraBaseURL(args map[string]any) (string, int, error) {
 		return "", http.StatusBadRequest, err
 	}
 
+	if s.cartographoorClient == nil {
+		return "", http.StatusServiceUnavailable, fmt.Errorf("dora is unavailable")
+	}
+
+	// Resolve the single requested network; the full map is only needed to
+	// list alternatives in the error.
+	if info, ok := s.cartographoorClient.GetNetwork(network); ok && info.Status == "active" &&
+		info.ServiceURLs != nil && info.ServiceURLs.Dora != "" {
+		return normalizeBaseURL(info.ServiceURLs.Dora), http.StatusOK, nil
+	}
+
 	networks, err := s.doraNetworks()
 	if err != nil {
 		return "", http.StatusServiceUnavailable, err
 	}
 
-	baseURL, ok := networks[network]
-	if !ok {
-		names := make([]string, 0, len(networks))
-		for name := range networks {
-			names = append(names, name)
-		}
-		sort.Strings(names)
-		return "", http.StatusNotFound, fmt.Errorf("unknown network %q. Available: %v", network, names)
+	names := make([]string, 0, len(networks))
+	for name := range networks {
+		names = append(names, name)
 	}
+	sort.Strings(names)
+	return "", http.StatusNotFound, fmt.Errorf("unknown network %q. Available: %v", network, names)
+}
 
-	return baseURL, http.StatusOK, nil
+// normalizeBaseURL strips trailing slashes once when a base URL is resolved,
+// so request and link builders can append paths directly.
+func normalizeBaseURL(baseURL string) string {
+	return strings.TrimRight(baseURL, "/")
 }
 
 func (s *service) doraAPIGet(
@@ -288,7 +311,7 @@ func (s *service) doraAPIGetRaw(
 	baseURL, path string,
 	params url.Values,
 ) ([]byte, string, int, error) {
-	requestURL := strings.TrimRight(baseURL, "/") + path
+	requestURL := baseURL + path
 	if len(params) > 0 {
 		requestURL += "?" + params.Encode()
 	}
@@ -283,8 +283,8 @@ func (s *service) handleEthNodeHexRPC(w http.ResponseWriter, r *http.Request, me
 		return
 	}
 
-	hexValue, ok := result.(string)
-	if !ok {
+	var hexValue string
+	if err := json.Unmarshal(result, &hexValue); err != nil {
 		http.Error(w, "unexpected JSON-RPC result shape", http.StatusBadGateway)
 		return
 	}
@@ -330,7 +330,7 @@ func (s *service) handleEthNodeExecutionRPCMethod(w http.ResponseWriter, r *http
 
 	writeOperationResponse(s.log, w, http.StatusOK, operations.Response{
 		Kind: operations.ResultKindObject,
-		Data: result,
+		Data: rpcResultData(result),
 		Meta: map[string]any{
 			"network":  network,
 			"instance": instance,
@@ -367,7 +367,7 @@ func (s *service) handleEthNodeGetBlockByNumber(w http.ResponseWriter, r *http.R
 
 	writeOperationResponse(s.log, w, http.StatusOK, operations.Response{
 		Kind: operations.ResultKindObject,
-		Data: result,
+		Data: rpcResultData(result),
 		Meta: map[string]any{
 			"network":  network,
 			"instance": instance,
@@ -495,26 +495,47 @@ func (s *service) ethNodeBeaconHealthRequest(ctx context.Context, network, insta
 	return status, http.StatusOK, nil
 }
 
+// ethNodeExecutionRPC returns the raw JSON-RPC result. Keeping it as
+// json.RawMessage lets large results (e.g. blocks with full transactions) be
+// written back verbatim instead of decoded into generic maps and re-encoded.
 func (s *service) ethNodeExecutionRPC(
 	ctx context.Context,
 	network, instance, method string,
 	params []any,
-) (any, int, error) {
+) (json.RawMessage, int, error) {
 	body, _, status, err := s.ethNodeExecutionRPCRaw(ctx, network, instance, method, params)
 	if err != nil {
 		return nil, status, err
 	}
 
 	var rpcResp struct {
-		Result any `json:"result"`
+		Result json.RawMessage `json:"result"`
 	}
 	if err := json.Unmarshal(body, &rpcResp); err != nil {
 		return nil, http.StatusBadGateway, fmt.Errorf("invalid JSON-RPC response: %w", err)
 	}
 
+	// A missing or null result stays nil so handlers omit "data" rather than
+	// writing "data": null. JSON-RPC error replies are already rejected by
+	// ethNodeExecutionRPCRaw.
+	if len(rpcResp.Result) == 0 || string(rpcResp.Result) == "null" {
+		return nil, http.StatusOK, nil
+	}
+
 	return rpcResp.Result, http.StatusOK, nil
 }
 
+// rpcResultData converts an execution RPC result into a response Data value.
+// A nil json.RawMessage would otherwise become a non-nil interface and defeat
+// omitempty.
+func rpcResultData(result json.RawMessage) any {
+	if result == nil {
+		return nil
+	}
+
+	return result
+}
+
 func (s *service) ethNodeExecutionRPCRaw(
 	ctx context.Context,
 	network, instance, method string,
@@ -63,6 +63,27 @@ type service struct {
 	running              bool
 }
 
+// Connection pool limits for the shared upstream client. Runtime operations
+// from concurrent sandbox executions mostly target a handful of hosts (the
+// proxy, Dora and CBT instances), so keep more idle connections per host than
+// the net/http default of 2 to avoid redialing under load.
+const (
+	upstreamMaxIdleConns        = 100
+	upstreamMaxIdleConnsPerHost = 32
+	upstreamIdleConnTimeout     = 90 * time.Second
+)
+
+// newUpstreamTransport returns the pooled transport shared by all server-side
+// upstream requests.
+func newUpstreamTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = upstreamMaxIdleConns
+	transport.MaxIdleConnsPerHost = upstreamMaxIdleConnsPerHost
+	transport.IdleConnTimeout = upstreamIdleConnTimeout
+
+	return transport
+}
+
 // NewService creates a new MCP server service.
 func NewService(
 	log logrus.FieldLogger,
@@ -93,7 +114,7 @@ func NewService(
 		proxyAuthMetadata:   proxyAuthMetadata,
 		runtimeTokens:       runtimeTokens,
 		cleanup:             cleanup,
-		httpClient:          &http.Client{Transport: &version.Transport{}, Timeout: 0},
+		httpClient:          &http.Client{Transport: &version.Transport{Base: newUpstreamTransport()}, Timeout: 0},
 		done:                make(chan struct{}),
 	}
 }
@@ -27,19 +27,47 @@ Example usage:
 """
 
 from . import storage
+from ._runtime import clear_cache
 
 # Integration modules are assembled at Docker build time
 # and can be imported as: from ethpandaops import clickhouse, prometheus, loki
-__all__ = ["storage"]
+__all__ = ["clear_cache", "preload", "storage"]
 __version__ = "0.1.0"
 
 
+_INTEGRATION_MODULES = ("cbt", "clickhouse", "prometheus", "loki", "dora", "ethnode")
+
+
 def __getattr__(name):
     """Lazy import for integration modules (clickhouse, prometheus, loki, dora)."""
-    if name in ("cbt", "clickhouse", "prometheus", "loki", "dora", "ethnode"):
+    if name in _INTEGRATION_MODULES:
         import importlib
 
         mod = importlib.import_module(f".{name}", __name__)
         globals()[name] = mod
         return mod
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def preload(*names: str) -> None:
+    """Import integration modules concurrently instead of on first access.
+
+    Args:
+        names: Modules to load. Defaults to every integration module that is
+            present in this build.
+    """
+    import importlib
+    import importlib.util
+    from concurrent.futures import ThreadPoolExecutor
+
+    wanted = names or tuple(
+        name
+        for name in _INTEGRATION_MODULES
+        if importlib.util.find_spec(f".{name}", __name__) is not None
+    )
+
+    def _load(name: str) -> None:
+        globals()[name] = importlib.import_module(f".{name}", __name__)
+
+    with ThreadPoolExecutor(max_workers=len(wanted) or 1) as pool:
+        list(pool.map(_load, wanted))
@@ -0,0 +1,69 @@
+"""Shared network map parsing for CBT and Dora modules."""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from types import MappingProxyType
+from typing import Mapping
+
+from ethpandaops import _runtime
+
+
+def raw(env_var: str) -> str:
+    """Return the stripped raw network JSON from an environment variable."""
+    return os.environ.get(env_var, "").strip()
+
+
+@functools.lru_cache(maxsize=8)
+def parse(raw: str) -> Mapping[str, str]:
+    """Parse a network name -> base URL JSON object.
+
+    Args:
+        raw: JSON object mapping network names to base URLs.
+
+    Returns:
+        Read-only mapping sorted by name, with trailing slashes stripped.
+        Empty when the value is missing or malformed.
+    """
+    if not raw:
+        return MappingProxyType({})
+
+    try:
+        networks = _runtime._json_loads(raw)
+    except json.JSONDecodeError:
+        return MappingProxyType({})
+
+    if not isinstance(networks, dict):
+        return MappingProxyType({})
+
+    return MappingProxyType(
+        {name: str(networks[name]).rstrip("/") for name in sorted(networks)}
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def records(raw: str, url_key: str) -> tuple[Mapping[str, str], ...]:
+    """Build read-only list_networks() records for a raw network JSON value.
+
+    Args:
+        raw: JSON object mapping network names to base URLs.
+        url_key: Record key for the base URL (e.g., "dora_url").
+
+    Returns:
+        Tuple of {"name", url_key} records sorted by name.
+    """
+    return tuple(
+        MappingProxyType({"name": name, url_key: url})
+        for name, url in parse(raw).items()
+    )
+
+
+def load(env_var: str) -> Mapping[str, str]:
+    """Load the network map for an environment variable.
+
+    Parsing is memoized per raw env value, so repeat calls are a cache hit and
+    a changed environment is still picked up.
+    """
+    return parse(raw(env_var))
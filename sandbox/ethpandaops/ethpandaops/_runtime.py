@@ -2,51 +2,391 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import csv
+import functools
+import importlib.util
 import io
 import json
+import math
 import os
-from typing import Any
-
-import httpx
-import pandas as pd
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, TypeVar
+
+# httpx (and its h11/anyio/certifi dependency tree) and pandas are imported
+# on first use, so scripts that only build deep links or read JSON never pay
+# for them.
+if TYPE_CHECKING:
+    import httpx
+    import pandas as pd
+    import pyarrow as pa
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _API_URL = os.environ.get("ETHPANDAOPS_API_URL", "")
 _API_TOKEN = os.environ.get("ETHPANDAOPS_API_TOKEN", "")
+_API_CONFIG_ERROR = (
+    None
+    if _API_URL and _API_TOKEN
+    else "Server API not configured. ETHPANDAOPS_API_URL and ETHPANDAOPS_API_TOKEN are required."
+)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_OPERATIONS_PATH = "/api/v1/runtime/operations/"
+
+# HTTP/2 lets concurrent batch operations multiplex over one connection. It
+# is only negotiated over TLS, so plain-http local servers stay on HTTP/1.1.
+_HTTP2 = _API_URL.startswith("https://") and importlib.util.find_spec("h2") is not None
+
+
+def _env_float(name: str, default: float) -> float:
+    # A malformed tuning variable must not make the package unimportable.
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Seconds to keep near-static catalog responses (datasources, networks,
+# models) before asking the server again. Zero disables caching.
+_CACHE_TTL = _env_float("ETHPANDAOPS_CACHE_TTL", 60.0)
+_CACHE: dict[tuple[Any, ...], tuple[float, Any]] = {}
+_CACHE_MAX_ENTRIES = 1024
+# Batch helpers call cached functions from worker threads.
+_CACHE_LOCK = threading.Lock()
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Upper bound on concurrent in-flight operations for batch helpers. Large
+# fan-out scripts can raise it; the connection pool is sized to match so
+# every worker keeps a warm keep-alive connection.
+_MAX_PARALLEL = max(1, _env_int("ETHPANDAOPS_MAX_PARALLEL", 8))
+
+# Transient overload responses (429, or 503 with Retry-After) are retried
+# with capped exponential backoff, honoring Retry-After, so one busy moment
+# does not fail a whole batch.
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.25
+_RETRY_MAX_DELAY = 5.0
+_RETRY_AFTER_MAX = 30.0
+
+# Shared across all module wrappers so repeated operations reuse pooled
+# keep-alive connections instead of paying a new handshake per call.
+_CLIENT: httpx.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def ttl_cache(func: _F | None = None, *, ttl: float | None = None) -> Any:
+    # Usable bare (@ttl_cache, default TTL) or with a per-function override
+    # for fast-moving data (@ttl_cache(ttl=6.0)). ETHPANDAOPS_CACHE_TTL=0
+    # disables both.
+    if func is None:
+        return functools.partial(ttl_cache, ttl=ttl)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with _CACHE_LOCK:
+            entry = _CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            return _copy_mutable(entry[1])
+
+        value = func(*args, **kwargs)
+        if _CACHE_TTL > 0:
+            _cache_store(
+                key, now + (_CACHE_TTL if ttl is None else ttl), _copy_mutable(value)
+            )
+        return value
+
+    return wrapper
+
+
+def _copy_mutable(value: Any) -> Any:
+    # Cached results are shared between calls, so lists and dicts are copied
+    # on the way in and out; a caller sorting or popping its result must not
+    # change what the next caller sees. Immutable snapshots (tuples,
+    # MappingProxyType, scalars) are shared as is.
+    if isinstance(value, dict):
+        return {key: _copy_mutable(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_mutable(item) for item in value]
+    return value
+
+
+def _cache_store(key: tuple[Any, ...], expires_at: float, value: Any) -> None:
+    with _CACHE_LOCK:
+        if len(_CACHE) >= _CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in _CACHE.items() if exp <= now]:
+                del _CACHE[stale]
+            # Still full of live entries: evict the oldest insertions.
+            while len(_CACHE) >= _CACHE_MAX_ENTRIES:
+                _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[key] = (expires_at, value)
+
+
+def clear_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def freeze_records(records: Any) -> tuple[Mapping[str, Any], ...]:
+    # Read-only snapshot that is safe to cache and share between calls.
+    if not isinstance(records, list):
+        return ()
+    return tuple(MappingProxyType(dict(record)) for record in records)
+
+
+def thaw_records(snapshot: tuple[Mapping[str, Any], ...]) -> list[dict[str, Any]]:
+    # Fresh mutable copies, so callers can never corrupt a cached snapshot.
+    return [dict(record) for record in snapshot]
 
 
 def _check_api_config() -> None:
-    if not _API_URL or not _API_TOKEN:
-        raise ValueError(
-            "Server API not configured. ETHPANDAOPS_API_URL and ETHPANDAOPS_API_TOKEN are required."
-        )
+    if _API_CONFIG_ERROR:
+        raise ValueError(_API_CONFIG_ERROR)
 
 
 def _get_client() -> httpx.Client:
-    _check_api_config()
-    return httpx.Client(
-        base_url=_API_URL,
-        headers={"Authorization": f"Bearer {_API_TOKEN}"},
-        timeout=httpx.Timeout(connect=5.0, read=300.0, write=60.0, pool=5.0),
+    global _CLIENT
+
+    # The config check only matters before the client exists; once built,
+    # the hot path is a single None test. Creation is locked so threads
+    # racing on first use share one pool instead of leaking extra clients.
+    if _CLIENT is not None:
+        return _CLIENT
+
+    with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            return _CLIENT
+
+        _check_api_config()
+        import httpx
+
+        _CLIENT = httpx.Client(
+            base_url=_API_URL,
+            headers={"Authorization": f"Bearer {_API_TOKEN}"},
+            timeout=httpx.Timeout(connect=5.0, read=300.0, write=60.0, pool=5.0),
+            # An explicit transport owns pooling and HTTP/2; its retries
+            # cover failed connects, which never reach the server.
+            transport=httpx.HTTPTransport(
+                http2=_HTTP2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=max(20, _MAX_PARALLEL),
+                    max_connections=max(100, _MAX_PARALLEL),
+                    keepalive_expiry=30.0,
+                ),
+                retries=_MAX_RETRIES,
+            ),
+        )
+
+    return _CLIENT
+
+
+def _close_client() -> None:
+    global _CLIENT
+
+    if _CLIENT is not None:
+        _CLIENT.close()
+        _CLIENT = None
+
+
+atexit.register(_close_client)
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            # orjson rejects integers beyond 64 bits, which JSON-RPC params
+            # carrying uint256 wei values routinely contain.
+            pass
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+# Twenty or more consecutive digits may be an integer beyond 64 bits, which
+# orjson either rejects or silently decodes as a lossy float depending on the
+# version. Such bodies (e.g. uint256 values in execution RPC results) are left
+# to the stdlib decoder, which keeps them exact.
+_WIDE_INTEGER = re.compile(rb"\d{20}")
+
+
+def _json_loads(body: bytes | str) -> Any:
+    if orjson is not None:
+        raw = body.encode() if isinstance(body, str) else body
+        if not _WIDE_INTEGER.search(raw):
+            return orjson.loads(raw)
+    return json.loads(body)
+
+
+def _operation_error(operation: str, response: httpx.Response) -> ValueError:
+    return ValueError(
+        f"Operation {operation} failed (HTTP {response.status_code}): "
+        f"{response.content.decode('utf-8', errors='replace').strip()}"
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _operation_url(operation: str) -> httpx.URL:
+    # Operation IDs are a small fixed set, so parse each endpoint URL once
+    # instead of re-parsing the same path string on every call.
+    import httpx
+
+    return httpx.URL(_OPERATIONS_PATH + operation)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    try:
+        retry_after = float(response.headers.get("retry-after", ""))
+    except ValueError:
+        retry_after = math.nan
+
+    # float() also accepts "nan", "inf" and negatives; time.sleep rejects
+    # some of them, so anything but a finite delay uses the backoff.
+    if math.isfinite(retry_after) and retry_after >= 0:
+        return min(retry_after, _RETRY_AFTER_MAX)
+    return min(_RETRY_BACKOFF * 2**attempt, _RETRY_MAX_DELAY)
+
+
+def _should_retry(response: httpx.Response) -> bool:
+    # 429 always means the request was not processed. The server also answers
+    # 503 for conditions that will not clear (e.g. "dora is unavailable"), so
+    # a 503 is only retried when it says when to come back.
+    if response.status_code == 429:
+        return True
+    return response.status_code == 503 and "retry-after" in response.headers
+
+
+def _send_operation(
+    operation: str, args: dict[str, Any] | None, *, stream: bool = False
+) -> httpx.Response:
+    client = _get_client()
+    request = client.build_request(
+        "POST",
+        _operation_url(operation),
+        content=_json_dumps({"args": args or {}}),
+        headers=_JSON_HEADERS,
+    )
+    for attempt in range(_MAX_RETRIES):
+        response = client.send(request, stream=stream)
+        if not _should_retry(response):
+            return response
+        response.close()
+        time.sleep(_retry_delay(response, attempt))
+
+    return client.send(request, stream=stream)
+
+
+@contextlib.contextmanager
+def _stream_operation(
+    operation: str, args: dict[str, Any] | None
+) -> Iterator[httpx.Response]:
+    response = _send_operation(operation, args, stream=True)
+    try:
+        yield response
+    finally:
+        response.close()
+
+
 def _invoke_bytes(
     operation: str, args: dict[str, Any] | None = None
 ) -> tuple[bytes, str]:
-    payload = {"args": args or {}}
-    with _get_client() as client:
-        response = client.post(f"/api/v1/runtime/operations/{operation}", json=payload)
-        body = response.read()
-        if not response.is_success:
-            raise ValueError(
-                f"Operation {operation} failed (HTTP {response.status_code}): "
-                f"{body.decode('utf-8', errors='replace').strip()}"
-            )
+    response = _send_operation(operation, args)
+    if not response.is_success:
+        raise _operation_error(operation, response)
+
+    return response.content, response.headers.get("content-type", "")
 
-        content_type = response.headers.get("content-type", "")
 
-    return body, content_type
+def iter_json_items(
+    operation: str, args: dict[str, Any] | None = None
+) -> Iterator[Any]:
+    # Yields elements of a top-level JSON array response as they arrive,
+    # falling back to decoding the full body when ijson is not installed.
+    with _stream_operation(operation, args) as response:
+        if not response.is_success:
+            response.read()
+            raise _operation_error(operation, response)
+
+        if ijson is None:
+            data = _decode_json(response.read(), operation)
+            yield from data if isinstance(data, list) else ()
+            return
+
+        items: list[Any] = ijson.sendable_list()
+        parser = ijson.items_coro(items, "item", use_float=True)
+        for chunk in response.iter_bytes():
+            parser.send(chunk)
+            yield from items
+            del items[:]
+        parser.close()
+        yield from items
+
+
+def invoke_json_fields(
+    operation: str,
+    args: dict[str, Any] | None,
+    prefix: str,
+    fields: list[str],
+) -> dict[str, Any]:
+    # Returns only the requested keys of the JSON object at prefix (ijson
+    # path, e.g. "data"). Unwanted values are parsed one key at a time and
+    # dropped, and the stream is closed as soon as every field has been seen.
+    wanted = set(fields)
+    with _stream_operation(operation, args) as response:
+        if not response.is_success:
+            response.read()
+            raise _operation_error(operation, response)
+
+        if ijson is None:
+            data = _decode_json(response.read(), operation)
+            for key in prefix.split(".") if prefix else ():
+                data = data.get(key) if isinstance(data, dict) else None
+            if not isinstance(data, dict):
+                return {}
+            return {key: data[key] for key in fields if key in data}
+
+        found: dict[str, Any] = {}
+        pairs: list[tuple[str, Any]] = ijson.sendable_list()
+        parser = ijson.kvitems_coro(pairs, prefix, use_float=True)
+        for chunk in response.iter_bytes():
+            parser.send(chunk)
+            for key, value in pairs:
+                if key in wanted:
+                    found[key] = value
+            del pairs[:]
+            if len(found) == len(wanted):
+                return found
+        parser.close()
+        for key, value in pairs:
+            if key in wanted:
+                found[key] = value
+        return found
 
 
 def _decode_json(body: bytes, operation: str) -> Any:
@@ -54,7 +394,7 @@ def _decode_json(body: bytes, operation: str) -> Any:
         return {}
 
     try:
-        return json.loads(body)
+        return _json_loads(body)
     except json.JSONDecodeError as exc:
         raise ValueError(
             "Unsupported server response shape. "
@@ -80,6 +420,28 @@ def invoke_json(operation: str, args: dict[str, Any] | None = None) -> Any:
     return _decode_json(body, operation)
 
 
+def _invoke_many(
+    invoke_fn: Callable[[str, dict[str, Any]], Any],
+    operation: str,
+    args_list: list[dict[str, Any]],
+) -> list[Any]:
+    if not args_list:
+        return []
+
+    # Create the shared client up front so worker threads reuse it.
+    _get_client()
+    if len(args_list) == 1:
+        return [invoke_fn(operation, args_list[0])]
+
+    # pool.map preserves input order, so results line up with args_list.
+    with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL, len(args_list))) as pool:
+        return list(pool.map(lambda args: invoke_fn(operation, args), args_list))
+
+
+def invoke_json_many(operation: str, args_list: list[dict[str, Any]]) -> list[Any]:
+    return _invoke_many(invoke_json, operation, args_list)
+
+
 def invoke_json_data(operation: str, args: dict[str, Any] | None = None) -> Any:
     payload = invoke_json(operation, args)
     if not isinstance(payload, dict):
@@ -88,9 +450,15 @@ def invoke_json_data(operation: str, args: dict[str, Any] | None = None) -> Any:
     return payload.get("data")
 
 
+def invoke_json_data_many(operation: str, args_list: list[dict[str, Any]]) -> list[Any]:
+    return _invoke_many(invoke_json_data, operation, args_list)
+
+
 def invoke_tsv_dataframe(
     operation: str, args: dict[str, Any] | None = None
 ) -> pd.DataFrame:
+    import pandas as pd
+
     body, _ = _invoke_bytes(operation, args)
     text = body.decode("utf-8")
     if not text.strip():
@@ -99,6 +467,66 @@ def invoke_tsv_dataframe(
     return pd.read_csv(io.StringIO(text), sep="\t")
 
 
+def invoke_arrow_table(
+    operation: str, args: dict[str, Any] | None = None
+) -> pa.Table:
+    # Reads an Arrow IPC stream body straight into typed columns, without the
+    # text parsing and per-cell type inference of the TSV path.
+    import pyarrow as pa
+
+    body, _ = _invoke_bytes(operation, args)
+    if not body:
+        return pa.table({})
+
+    return pa.ipc.open_stream(body).read_all()
+
+
+class _ResponseReader(io.RawIOBase):
+    # Minimal read-only file over a streamed response body, for decoders that
+    # pull bytes (pyarrow IPC) rather than accept pushed chunks.
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.iter_bytes()
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, b"")
+            if not self._pending:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def iter_arrow_batches(
+    operation: str, args: dict[str, Any] | None = None
+) -> Iterator[pa.RecordBatch]:
+    # Decodes an Arrow IPC stream one record batch at a time as the body
+    # arrives, so large results never have to be held as a single table.
+    import pyarrow as pa
+
+    with _stream_operation(operation, args) as response:
+        if not response.is_success:
+            response.read()
+            raise _operation_error(operation, response)
+
+        source = io.BufferedReader(_ResponseReader(response))
+        if not source.peek(1):
+            return
+
+        yield from pa.ipc.open_stream(source)
+
+
+def invoke_tsv_dataframe_many(
+    operation: str, args_list: list[dict[str, Any]]
+) -> list[pd.DataFrame]:
+    return _invoke_many(invoke_tsv_dataframe, operation, args_list)
+
+
 def invoke_tsv_rows(
     operation: str, args: dict[str, Any] | None = None
 ) -> tuple[list[tuple[str, ...]], list[str]]:
@@ -117,6 +545,12 @@ def invoke_tsv_rows(
     return rows, columns
 
 
+def invoke_tsv_rows_many(
+    operation: str, args_list: list[dict[str, Any]]
+) -> list[tuple[list[tuple[str, ...]], list[str]]]:
+    return _invoke_many(invoke_tsv_rows, operation, args_list)
+
+
 def invoke_data(operation: str, args: dict[str, Any] | None = None) -> Any:
     response = invoke(operation, args)
     if response.get("kind") != "object":
@@ -125,6 +559,10 @@ def invoke_data(operation: str, args: dict[str, Any] | None = None) -> Any:
     return response.get("data")
 
 
+def invoke_data_many(operation: str, args_list: list[dict[str, Any]]) -> list[Any]:
+    return _invoke_many(invoke_data, operation, args_list)
+
+
 def invoke_dataframe(operation: str, args: dict[str, Any] | None = None) -> pd.DataFrame:
     return invoke_tsv_dataframe(operation, args)
 
@@ -15,22 +15,25 @@ Example:
     url = storage.upload("/workspace/data.csv", remote_name="results.csv")
 """
 
-from pathlib import Path
+from __future__ import annotations
 
-import httpx
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ethpandaops import _runtime
 
+if TYPE_CHECKING:
+    import httpx
 
-def _get_client() -> httpx.Client:
-    """Get an HTTP client configured for the local server API."""
-    _runtime._check_api_config()
+# Uploads can be large, so they get a longer write timeout than the shared
+# runtime client's default. Given as an httpx (connect, read, write, pool)
+# tuple so importing this module does not pull in httpx.
+_UPLOAD_TIMEOUT = (5.0, 300.0, 300.0, 5.0)
 
-    return httpx.Client(
-        base_url=_runtime._API_URL,
-        headers={"Authorization": f"Bearer {_runtime._API_TOKEN}"},
-        timeout=httpx.Timeout(connect=5.0, read=300.0, write=300.0, pool=5.0),
-    )
+
+def _get_client() -> httpx.Client:
+    """Get the shared HTTP client configured for the local server API."""
+    return _runtime._get_client()
 
 
 def upload(local_path: str, remote_name: str | None = None) -> str:
@@ -61,16 +64,16 @@ def upload(local_path: str, remote_name: str | None = None) -> str:
 
     content_type = _get_content_type(path.suffix)
 
-    with _get_client() as client:
-        with open(path, "rb") as f:
-            response = client.post(
-                "/api/v1/runtime/storage/upload",
-                content=f.read(),
-                params={"name": remote_name},
-                headers={"Content-Type": content_type},
-            )
-            response.raise_for_status()
-            payload = response.json()
+    with open(path, "rb") as f:
+        response = _get_client().post(
+            "/api/v1/runtime/storage/upload",
+            content=f.read(),
+            params={"name": remote_name},
+            headers={"Content-Type": content_type},
+            timeout=_UPLOAD_TIMEOUT,
+        )
+    response.raise_for_status()
+    payload = _runtime._json_loads(response.content)
 
     return payload.get("url", "")
 
@@ -114,10 +117,9 @@ def list_files(prefix: str = "") -> list[dict]:
     if prefix:
         params["prefix"] = prefix
 
-    with _get_client() as client:
-        response = client.get("/api/v1/runtime/storage/files", params=params)
-        response.raise_for_status()
-        payload = response.json()
+    response = _get_client().get("/api/v1/runtime/storage/files", params=params)
+    response.raise_for_status()
+    payload = _runtime._json_loads(response.content)
 
     files = payload.get("files", [])
     return files if isinstance(files, list) else []
@@ -132,9 +134,8 @@ def get_url(key: str) -> str:
     Returns:
         Public URL for the file.
     """
-    with _get_client() as client:
-        response = client.get("/api/v1/runtime/storage/url", params={"key": key})
-        response.raise_for_status()
-        payload = response.json()
+    response = _get_client().get("/api/v1/runtime/storage/url", params={"key": key})
+    response.raise_for_status()
+    payload = _runtime._json_loads(response.content)
 
     return payload.get("url", "")
@@ -0,0 +1,76 @@
+"""Shared fixtures for the sandbox runtime tests."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterator
+
+import httpx
+import pytest
+
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+_MODULES_ROOT = _PACKAGE_ROOT.parents[1] / "modules"
+
+sys.path.insert(0, str(_PACKAGE_ROOT))
+
+from ethpandaops import _runtime  # noqa: E402
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry backoff delays instead of sleeping."""
+    recorded: list[float] = []
+    monkeypatch.setattr(_runtime.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.fixture
+def mock_server(
+    monkeypatch: pytest.MonkeyPatch, sleeps: list[float]
+) -> Iterator[Callable[[Handler], list[httpx.Request]]]:
+    """Route the shared runtime client through an httpx.MockTransport.
+
+    Returns an installer that takes a request handler and returns the list
+    of requests the handler received.
+    """
+    _runtime.clear_cache()
+
+    def install(handler: Handler) -> list[httpx.Request]:
+        requests: list[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        client = httpx.Client(
+            base_url="http://server.test",
+            transport=httpx.MockTransport(record),
+        )
+        monkeypatch.setattr(_runtime, "_CLIENT", client)
+        return requests
+
+    yield install
+    _runtime.clear_cache()
+
+
+def load_module(name: str) -> ModuleType:
+    """Import a module wrapper as ethpandaops.<name>.
+
+    The sandbox image copies modules/<name>/python/<name>.py into the
+    package; tests load the same file from the source tree.
+    """
+    qualified = f"ethpandaops.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+
+    path = _MODULES_ROOT / name / "python" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(qualified, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,135 @@
+"""TTL cache used for catalog lookups."""
+
+from __future__ import annotations
+
+import threading
+from types import MappingProxyType
+
+import pytest
+
+from ethpandaops import _runtime
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    _runtime.clear_cache()
+    yield
+    _runtime.clear_cache()
+
+
+def test_cache_hit_skips_call():
+    calls = []
+
+    @_runtime.ttl_cache
+    def lookup(network: str) -> list[dict[str, str]]:
+        calls.append(network)
+        return [{"id": "a"}, {"id": "b"}]
+
+    assert lookup("mainnet") == lookup("mainnet")
+    assert calls == ["mainnet"]
+
+
+def test_cached_results_are_isolated_from_caller_mutation():
+    @_runtime.ttl_cache
+    def lookup() -> dict[str, list[dict[str, str]]]:
+        return {"models": [{"id": "b"}, {"id": "a"}]}
+
+    first = lookup()
+    first["models"].sort(key=lambda model: model["id"])
+    first["models"][0]["id"] = "mutated"
+    first["extra"] = []
+
+    second = lookup()
+    second["models"].pop()
+
+    assert lookup() == {"models": [{"id": "b"}, {"id": "a"}]}
+
+
+def test_immutable_snapshots_are_shared():
+    snapshot = (MappingProxyType({"name": "mainnet"}),)
+
+    @_runtime.ttl_cache
+    def lookup() -> tuple[MappingProxyType, ...]:
+        return snapshot
+
+    assert lookup() is snapshot
+    assert lookup() is snapshot
+
+
+def test_zero_ttl_disables_caching(monkeypatch):
+    monkeypatch.setattr(_runtime, "_CACHE_TTL", 0.0)
+    calls = []
+
+    @_runtime.ttl_cache
+    def lookup() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert [lookup(), lookup()] == [1, 2]
+
+
+def test_expired_entries_are_refetched(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_runtime.time, "monotonic", lambda: now[0])
+    calls = []
+
+    @_runtime.ttl_cache(ttl=6.0)
+    def lookup() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert lookup() == 1
+    now[0] += 5.0
+    assert lookup() == 1
+    now[0] += 2.0
+    assert lookup() == 2
+
+
+def test_full_cache_evicts_expired_then_oldest(monkeypatch):
+    monkeypatch.setattr(_runtime, "_CACHE_MAX_ENTRIES", 3)
+    now = [1000.0]
+    monkeypatch.setattr(_runtime.time, "monotonic", lambda: now[0])
+
+    _runtime._cache_store(("expired",), 999.0, 0)
+    _runtime._cache_store(("old",), 2000.0, 1)
+    _runtime._cache_store(("mid",), 2000.0, 2)
+    _runtime._cache_store(("new",), 2000.0, 3)
+
+    assert list(_runtime._CACHE) == [("old",), ("mid",), ("new",)]
+
+    _runtime._cache_store(("newest",), 2000.0, 4)
+
+    assert list(_runtime._CACHE) == [("mid",), ("new",), ("newest",)]
+
+
+def test_concurrent_stores_do_not_race(monkeypatch):
+    monkeypatch.setattr(_runtime, "_CACHE_MAX_ENTRIES", 16)
+    errors: list[BaseException] = []
+
+    def fill(worker: int) -> None:
+        try:
+            for i in range(2000):
+                _runtime._cache_store((worker, i), 0.0, i)
+        except BaseException as exc:  # pragma: no cover - failure path
+            errors.append(exc)
+
+    threads = [threading.Thread(target=fill, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(_runtime._CACHE) <= 16
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [(None, 60.0), ("15", 15.0), ("soon", 60.0)]
+)
+def test_env_float_falls_back_on_malformed_values(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("ETHPANDAOPS_CACHE_TTL", raising=False)
+    else:
+        monkeypatch.setenv("ETHPANDAOPS_CACHE_TTL", value)
+
+    assert _runtime._env_float("ETHPANDAOPS_CACHE_TTL", 60.0) == expected
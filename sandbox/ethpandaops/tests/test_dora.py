@@ -0,0 +1,52 @@
+"""Dora wrapper caching."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from conftest import load_module
+
+dora = load_module("dora")
+
+
+@pytest.fixture(autouse=True)
+def _dora_networks(monkeypatch):
+    monkeypatch.setenv(
+        "ETHPANDAOPS_DORA_NETWORKS", '{"mainnet": "https://dora.mainnet.test/"}'
+    )
+
+
+def test_network_overview_cache_is_not_poisoned_by_callers(mock_server):
+    requests = mock_server(
+        lambda request: httpx.Response(
+            200,
+            json={
+                "kind": "object",
+                "data": {"current_epoch": 10, "finalized": True},
+            },
+        )
+    )
+
+    first = dora.get_network_overview("mainnet")
+    first["current_epoch"] = -1
+    first.pop("finalized")
+
+    assert dora.get_network_overview("mainnet") == {
+        "current_epoch": 10,
+        "finalized": True,
+    }
+    assert len(requests) == 1
+
+
+def test_epoch_cache_is_not_poisoned_by_callers(mock_server):
+    requests = mock_server(
+        lambda request: httpx.Response(
+            200, json={"data": {"epoch": 5, "validators": [1, 2, 3]}}
+        )
+    )
+
+    first = dora.get_epoch("mainnet", 5)
+    first["validators"].clear()
+
+    assert dora.get_epoch("mainnet", 5) == {"epoch": 5, "validators": [1, 2, 3]}
+    assert len(requests) == 1
@@ -0,0 +1,44 @@
+"""JSON encoding and decoding."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+
+from ethpandaops import _runtime
+
+
+def test_json_dumps_handles_integers_beyond_64_bits():
+    assert json.loads(_runtime._json_dumps({"value": 2**70})) == {"value": 2**70}
+
+
+def test_invoke_sends_uint256_params(mock_server):
+    wei = 2**255 + 1
+    requests = mock_server(
+        lambda request: httpx.Response(200, json={"kind": "object", "data": {}})
+    )
+
+    _runtime.invoke("ethnode.rpc", {"params": [hex(1), wei]})
+
+    assert json.loads(requests[0].content) == {"args": {"params": ["0x1", wei]}}
+
+
+def test_json_loads_keeps_integers_beyond_64_bits_exact():
+    body = _runtime._json_dumps({"value": 2**70, "small": 7})
+
+    decoded = _runtime._json_loads(body)
+
+    assert decoded == {"value": 2**70, "small": 7}
+    assert isinstance(decoded["value"], int)
+
+
+def test_invoke_json_returns_exact_uint256_result(mock_server):
+    wei = 2**255 + 1
+    mock_server(
+        lambda request: httpx.Response(
+            200, content=f'{{"data": {{"balance": {wei}}}}}'.encode()
+        )
+    )
+
+    assert _runtime.invoke_json_data("ethnode.get_balance") == {"balance": wei}
@@ -0,0 +1,42 @@
+"""Network map parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from ethpandaops import _net
+
+
+def test_parse_sorts_names_and_strips_trailing_slashes():
+    networks = _net.parse('{"sepolia": "https://s.test/", "mainnet": "https://m.test"}')
+
+    assert list(networks) == ["mainnet", "sepolia"]
+    assert networks["sepolia"] == "https://s.test"
+
+
+@pytest.mark.parametrize("raw", ["", "not json", "[1, 2]", '"mainnet"'])
+def test_parse_returns_empty_map_for_missing_or_malformed_values(raw):
+    assert dict(_net.parse(raw)) == {}
+
+
+def test_parse_result_is_read_only():
+    networks = _net.parse('{"mainnet": "https://m.test"}')
+
+    with pytest.raises(TypeError):
+        networks["holesky"] = "https://h.test"
+
+
+def test_records_use_requested_url_key():
+    records = _net.records('{"mainnet": "https://m.test/"}', "dora_url")
+
+    assert [dict(record) for record in records] == [
+        {"name": "mainnet", "dora_url": "https://m.test"}
+    ]
+
+
+def test_load_picks_up_changed_environment(monkeypatch):
+    monkeypatch.setenv("ETHPANDAOPS_TEST_NETWORKS", '{"mainnet": "https://m.test"}')
+    assert list(_net.load("ETHPANDAOPS_TEST_NETWORKS")) == ["mainnet"]
+
+    monkeypatch.setenv("ETHPANDAOPS_TEST_NETWORKS", '{"hoodi": "https://h.test"}')
+    assert list(_net.load("ETHPANDAOPS_TEST_NETWORKS")) == ["hoodi"]
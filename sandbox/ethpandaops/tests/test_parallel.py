@@ -0,0 +1,67 @@
+"""Batch fan-out helpers."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from ethpandaops import _runtime
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [(None, 8), ("32", 32), ("lots", 8), ("2.5", 8)]
+)
+def test_env_int_falls_back_on_malformed_values(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("ETHPANDAOPS_MAX_PARALLEL", raising=False)
+    else:
+        monkeypatch.setenv("ETHPANDAOPS_MAX_PARALLEL", value)
+
+    assert _runtime._env_int("ETHPANDAOPS_MAX_PARALLEL", 8) == expected
+
+
+def test_invoke_many_preserves_input_order(mock_server):
+    last_arrived = threading.Event()
+
+    def handler(request):
+        index = json.loads(request.content)["args"]["index"]
+        if index == 0:
+            # Hold the first request until the last one has been sent so
+            # results complete out of order.
+            assert last_arrived.wait(timeout=5)
+        if index == 3:
+            last_arrived.set()
+        return httpx.Response(200, json={"data": index})
+
+    requests = mock_server(handler)
+
+    results = _runtime.invoke_json_data_many(
+        "dora.get_slot", [{"index": index} for index in range(4)]
+    )
+
+    assert results == [0, 1, 2, 3]
+    assert len(requests) == 4
+
+
+def test_invoke_many_empty_args_sends_nothing(mock_server):
+    requests = mock_server(lambda request: httpx.Response(200, json={"data": None}))
+
+    assert _runtime.invoke_json_data_many("dora.get_slot", []) == []
+    assert requests == []
+
+
+def test_invoke_many_propagates_errors(mock_server):
+    def handler(request):
+        if json.loads(request.content)["args"]["index"] == 1:
+            return httpx.Response(400, text="unknown slot")
+        return httpx.Response(200, json={"data": "ok"})
+
+    mock_server(handler)
+
+    with pytest.raises(ValueError, match="unknown slot"):
+        _runtime.invoke_json_data_many(
+            "dora.get_slot", [{"index": index} for index in range(3)]
+        )
@@ -0,0 +1,88 @@
+"""Retry behaviour of runtime operation requests."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from ethpandaops import _runtime
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"kind": "object", "data": {"ok": True}})
+
+
+def test_plain_503_fails_without_retry(mock_server, sleeps):
+    requests = mock_server(
+        lambda request: httpx.Response(503, text="dora is unavailable")
+    )
+
+    with pytest.raises(ValueError, match="HTTP 503.*dora is unavailable"):
+        _runtime.invoke_data("dora.get_base_url", {"network": "mainnet"})
+
+    assert len(requests) == 1
+    assert sleeps == []
+
+
+def test_503_with_retry_after_is_retried(mock_server, sleeps):
+    responses = iter([httpx.Response(503, headers={"Retry-After": "2"})])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(responses, None) or _ok(request)
+
+    requests = mock_server(handler)
+
+    assert _runtime.invoke_data("dora.get_base_url", {"network": "mainnet"}) == {
+        "ok": True
+    }
+    assert len(requests) == 2
+    assert sleeps == [2.0]
+
+
+def test_429_is_retried_with_backoff(mock_server, sleeps):
+    responses = iter([httpx.Response(429), httpx.Response(429)])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(responses, None) or _ok(request)
+
+    requests = mock_server(handler)
+
+    assert _runtime.invoke_data("cbt.list_networks") == {"ok": True}
+    assert len(requests) == 3
+    assert sleeps == [_runtime._RETRY_BACKOFF, _runtime._RETRY_BACKOFF * 2]
+
+
+def test_persistent_429_gives_up_after_max_retries(mock_server, sleeps):
+    requests = mock_server(lambda request: httpx.Response(429, text="busy"))
+
+    with pytest.raises(ValueError, match="HTTP 429"):
+        _runtime.invoke_data("cbt.list_networks")
+
+    assert len(requests) == _runtime._MAX_RETRIES + 1
+    assert len(sleeps) == _runtime._MAX_RETRIES
+
+
+@pytest.mark.parametrize("retry_after", ["nan", "inf", "-5", "soon"])
+def test_malformed_retry_after_falls_back_to_backoff(mock_server, sleeps, retry_after):
+    responses = iter([httpx.Response(503, headers={"Retry-After": retry_after})])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(responses, None) or _ok(request)
+
+    requests = mock_server(handler)
+
+    assert _runtime.invoke_data("cbt.list_networks") == {"ok": True}
+    assert len(requests) == 2
+    assert sleeps == [_runtime._RETRY_BACKOFF]
+
+
+def test_retry_after_is_capped(mock_server, sleeps):
+    responses = iter([httpx.Response(429, headers={"Retry-After": "3600"})])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(responses, None) or _ok(request)
+
+    mock_server(handler)
+
+    assert _runtime.invoke_data("cbt.list_networks") == {"ok": True}
+    assert sleeps == [_runtime._RETRY_AFTER_MAX]
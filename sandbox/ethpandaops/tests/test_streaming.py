@@ -0,0 +1,122 @@
+"""Streaming JSON and Arrow decoding."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pyarrow as pa
+import pytest
+
+from ethpandaops import _runtime
+
+
+def _chunked(body: bytes, size: int = 7) -> httpx.Response:
+    # Small chunks make decoders see values split across reads.
+    return httpx.Response(
+        200, content=iter([body[i : i + size] for i in range(0, len(body), size)])
+    )
+
+
+@pytest.fixture(params=["ijson", "fallback"])
+def json_backend(request, monkeypatch):
+    if request.param == "fallback":
+        monkeypatch.setattr(_runtime, "ijson", None)
+    elif _runtime.ijson is None:
+        pytest.skip("ijson is not installed")
+    return request.param
+
+
+def test_iter_json_items_yields_array_elements(mock_server, json_backend):
+    rows = [{"slot": slot, "root": f"0x{slot:02x}"} for slot in range(20)]
+    mock_server(lambda request: _chunked(json.dumps(rows).encode()))
+
+    assert list(_runtime.iter_json_items("dora.list_slots")) == rows
+
+
+def test_iter_json_items_ignores_non_array_body(mock_server, json_backend):
+    mock_server(lambda request: _chunked(b'{"kind": "object"}'))
+
+    assert list(_runtime.iter_json_items("dora.list_slots")) == []
+
+
+def test_iter_json_items_raises_on_error_status(mock_server, json_backend):
+    mock_server(lambda request: httpx.Response(400, text="bad network"))
+
+    with pytest.raises(ValueError, match="bad network"):
+        list(_runtime.iter_json_items("dora.list_slots"))
+
+
+def test_invoke_json_fields_keeps_requested_keys(mock_server, json_backend):
+    body = {
+        "kind": "object",
+        "data": {"epoch": 5, "validators": list(range(50)), "finalized": True},
+    }
+    mock_server(lambda request: _chunked(json.dumps(body).encode()))
+
+    fields = _runtime.invoke_json_fields(
+        "dora.get_epoch", {}, "data", ["epoch", "finalized", "missing"]
+    )
+
+    assert fields == {"epoch": 5, "finalized": True}
+
+
+def test_invoke_json_fields_stops_reading_once_all_fields_seen(mock_server):
+    if _runtime.ijson is None:
+        pytest.skip("ijson is not installed")
+
+    def body():
+        yield b'{"data": {"epoch": 5, '
+        # A pair is emitted once the next key starts, so the large trailing
+        # value must never be read.
+        yield b'"finalized": true, "validators": ['
+        raise AssertionError("stream read past the wanted fields")
+
+    mock_server(lambda request: httpx.Response(200, content=body()))
+
+    assert _runtime.invoke_json_fields(
+        "dora.get_epoch", {}, "data", ["epoch", "finalized"]
+    ) == {"epoch": 5, "finalized": True}
+
+
+def _arrow_stream(table: pa.Table, max_chunksize: int) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=max_chunksize)
+    return sink.getvalue().to_pybytes()
+
+
+def test_iter_arrow_batches_decodes_chunked_stream(mock_server):
+    table = pa.table({"slot": list(range(10)), "proposer": list(range(100, 110))})
+    mock_server(lambda request: _chunked(_arrow_stream(table, max_chunksize=4)))
+
+    batches = list(_runtime.iter_arrow_batches("clickhouse.query_arrow"))
+
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
+    assert pa.Table.from_batches(batches).equals(table)
+
+
+def test_iter_arrow_batches_empty_body_yields_nothing(mock_server):
+    mock_server(lambda request: httpx.Response(200, content=b""))
+
+    assert list(_runtime.iter_arrow_batches("clickhouse.query_arrow")) == []
+
+
+def test_iter_arrow_batches_raises_on_error_status(mock_server):
+    mock_server(lambda request: httpx.Response(400, text="syntax error"))
+
+    with pytest.raises(ValueError, match="syntax error"):
+        list(_runtime.iter_arrow_batches("clickhouse.query_arrow"))
+
+
+def test_invoke_arrow_table(mock_server):
+    table = pa.table({"slot": [1, 2, 3]})
+    mock_server(lambda request: httpx.Response(200, content=_arrow_stream(table, 2)))
+
+    assert _runtime.invoke_arrow_table("clickhouse.query_arrow").equals(table)
+
+
+def test_invoke_arrow_table_empty_body(mock_server):
+    mock_server(lambda request: httpx.Response(200, content=b""))
+
+    assert _runtime.invoke_arrow_table("clickhouse.query_arrow").num_rows == 0